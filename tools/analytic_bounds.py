@@ -87,17 +87,30 @@ def mp_str(x):
     return mp.nstr(mp.mpf(x), n=mp.dps, strip_zeros=False)
 
 
-def sha256_bytes(b: bytes) -> str:
-    h = hashlib.sha256()
-    h.update(b)
-    return h.hexdigest()
+SHA_PLACEHOLDER = "<SHA256_PLACEHOLDER>"
 
 
 def write_json_with_sha(path: str, payload: dict) -> str:
+    """
+    Serialize once with meta.sha256 = SHA_PLACEHOLDER. The digest covers the
+    bytes with meta.sha256 == "" (hashed in slices around the placeholder),
+    and is then written in place of it, so the payload is never copied.
+    """
+    payload["meta"]["sha256"] = SHA_PLACEHOLDER
     raw = json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
-    with open(path, "wb") as f:
-        f.write(raw)
-    return sha256_bytes(raw)
+    placeholder = SHA_PLACEHOLDER.encode("ascii")
+    i = raw.index(placeholder)
+    j = i + len(placeholder)
+    view = memoryview(raw)
+    h = hashlib.sha256(view[:i])
+    h.update(view[j:])
+    sha = h.hexdigest()
+    payload["meta"]["sha256"] = sha
+    with open(path, "wb", buffering=65536) as f:
+        f.write(view[:i])
+        f.write(sha.encode("ascii"))
+        f.write(view[j:])
+    return sha
 
 
 # ---------- analytic bounds (math unchanged) ----------
@@ -156,19 +169,24 @@ def main():
     # a=1.0 is the default “amplitude” used downstream (matches analytic_tail_fit output)
     a_val = mp.mpf("1")
 
+    # Format each value once; the blocks and aliases below share these strings.
+    s_c1, s_c2, s_a, s_C, s_A_prime, s_grid_error_hi = map(
+        mp_str, (c1, c2, a_val, C, args.A_prime, grid_error_hi)
+    )
+
     gamma_block = {
-        "c1": mp_str(c1),
-        "c2": mp_str(c2),
+        "c1": s_c1,
+        "c2": s_c2,
         # Treat c1 as the effective C used for gamma tails (matches the 1 + 1/sigma shape)
-        "C": mp_str(c1),
-        "a": mp_str(a_val),
+        "C": s_c1,
+        "a": s_a,
     }
 
     prime_block = {
-        "C": mp_str(C),
+        "C": s_C,
         "K": int(args.K),
-        "A_prime": mp_str(args.A_prime),
-        "a": mp_str(a_val),
+        "A_prime": s_A_prime,
+        "a": s_a,
     }
 
     payload = {
@@ -189,15 +207,15 @@ def main():
             # Alias block for tools expecting "prime_tail" under analytic_bounds
             "prime_tail": prime_block,
             # Effective epsilon lower bound (alias of C)
-            "eps_eff_lo": mp_str(C),
+            "eps_eff_lo": s_C,
             # Grid error upper bound re-exported from op_grid_error_bound.py
-            "grid_error_hi": mp_str(grid_error_hi),
+            "grid_error_hi": s_grid_error_hi,
         },
         # Top-level aliases for tools that read these directly
         "gamma_tail": gamma_block,
         "prime_tail": prime_block,
-        "eps_eff_lo": mp_str(C),
-        "grid_error_hi": mp_str(grid_error_hi),
+        "eps_eff_lo": s_C,
+        "grid_error_hi": s_grid_error_hi,
         "meta": {
             "tool": "analytic_bounds",
             "dps": str(args.dps),
@@ -208,14 +226,12 @@ def main():
         },
     }
 
-    sha = write_json_with_sha(args.out, payload)
-    payload["meta"]["sha256"] = sha
     write_json_with_sha(args.out, payload)
 
     print(f"[ok] analytic_bounds -> {args.out}")
     print(
         f"[analytic_bounds] sigma={args.sigma}  A_prime={args.A_prime}  "
-        f"K={args.K}  C={mp_str(C)}  grid_error_hi={mp_str(grid_error_hi)}"
+        f"K={args.K}  C={s_C}  grid_error_hi={s_grid_error_hi}"
     )
 
 
@@ -2,50 +2,360 @@
 # tools/analytic_tail_fit.py
 
 import argparse, json, os, sys, time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict
 from mpmath import mp, mpf
 
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
+
 
 def nows() -> str:
     return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
 
 def load_json(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
-def dig(obj: Any, path):
-    cur = obj
-    for k in path:
-        if not isinstance(cur, dict) or k not in cur:
-            return None
-        cur = cur[k]
-    return cur
+    with open(path, "rb", buffering=65536) as f:
+        data = f.read()
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            pass  # NaN / >64-bit integers: let the stdlib parser handle them
+    return json.loads(data)
 
 
 def coalesce(obj, paths, default=None):
-    for p in paths:
-        v = dig(obj, p)
-        if v not in (None, "", "null"):
-            return v
+    for path in paths:
+        cur = obj
+        try:
+            for k in path:
+                cur = cur[k]
+        except (KeyError, TypeError, IndexError):
+            continue
+        if cur not in (None, "", "null"):
+            return cur
     return default
 
 
+# Schema-tolerant lookup paths, in order of preference.
+EPS_EFF_PATHS = (("numbers", "epsilon_eff"), ("numbers", "eps_eff"))
+GRID_HI_PATHS = (("grid_error_bound", "bound_hi"), ("numbers", "grid_error_norm"))
+PRIME_T0_PATHS = (("inputs", "T0"), ("T0",), ("prime_tail", "T0"))
+PRIME_ENV_PATHS = (
+    ("prime_tail", "env_T0_hi"),
+    ("prime_tail_envelope", "env_T0_hi"),
+    ("numbers", "prime_tail_norm"),
+)
+GAMMA_T0_PATHS = (("inputs", "T0"), ("T0",), ("gamma_tail", "T0"))
+GAMMA_ENV_PATHS = (
+    ("gamma_tails", "gamma_env_at_T0"),
+    ("gamma_tail", "gamma_env_at_T0"),
+    ("gamma_env_at_T0",),
+)
+
+
+class TailFitError(Exception):
+    pass
+
+
+def _to_mpf(x, what: str):
+    try:
+        return mp.mpf(str(x))
+    except ValueError:
+        raise TailFitError(f"{what} is not a number: {x!r}")
+
+
 def mp_str(x) -> str:
     return mp.nstr(mp.mpf(x), n=mp.dps, strip_zeros=False)
 
 
+# Input keys accepted by fit_one (file stems inside a PROOF_PACKET directory).
+INPUT_KEYS = (
+    "continuum_operator_cert",
+    "grid_error_bound",
+    "prime_tail_envelope",
+    "gamma_tails",
+)
+
+
+def packet_paths(pkt: str) -> Dict[str, str]:
+    """Input paths for a PROOF_PACKET directory, keyed like INPUT_KEYS."""
+    # Gamma tails: prefer v2.1 gamma_tails.json, fall back to legacy gamma_tail.json
+    p_gt = os.path.join(pkt, "gamma_tails.json")
+    if not os.path.exists(p_gt):
+        p_gt = os.path.join(pkt, "gamma_tail.json")
+    return {
+        "continuum_operator_cert": os.path.join(pkt, "continuum_operator_cert.json"),
+        "grid_error_bound": os.path.join(pkt, "grid_error_bound.json"),
+        "prime_tail_envelope": os.path.join(pkt, "prime_tail_envelope.json"),
+        "gamma_tails": p_gt,
+    }
+
+
+def fit_one(paths: Dict[str, str], Ap: str, Ag: str, dps: int, packet_dir: str = None):
+    """
+    Fit tail models from explicit input paths (keys as in INPUT_KEYS) and
+    return the analytic_tail_fit payload without writing it.
+    """
+    return _fit(paths, Ap, Ag, dps, packet_dir)[0]
+
+
+def fit_packet(pkt: str, Ap: str, Ag: str, dps: int, out_path: str = None):
+    """
+    Fit one PROOF_PACKET directory and write analytic_tail_fit.json.
+
+    Returns (out_path, numbers) where numbers holds the mpf values that were
+    serialized. Raises TailFitError on missing, unreadable or malformed
+    inputs/fields.
+    """
+    out_path = out_path or os.path.join(pkt, "analytic_tail_fit.json")
+    out, numbers = _fit(packet_paths(pkt), Ap, Ag, dps, pkt)
+    write_fit(out, out_path)
+    return out_path, numbers
+
+
+def write_fit(out: Dict[str, Any], out_path: str):
+    with open(out_path, "w", encoding="utf-8", newline="\n") as f:
+        json.dump(out, f, indent=2, ensure_ascii=False)
+
+
+def _fit(paths, Ap, Ag, dps, packet_dir):
+    # workdps so library callers get the precision the payload reports; the
+    # CLI sets mp.dps to the same value first, so concurrent manifest threads
+    # all save and restore one precision.
+    with mp.workdps(int(dps)):
+        if packet_dir is None:
+            packet_dir = os.path.dirname(paths.get("continuum_operator_cert", ""))
+        docs = []
+        for key in INPUT_KEYS:
+            try:
+                path = paths[key]
+            except KeyError as e:
+                raise TailFitError(f"missing input path {e}")
+            try:
+                docs.append(load_json(path))
+            except FileNotFoundError as e:
+                raise TailFitError(f"missing file: {e}")
+            except OSError as e:
+                raise TailFitError(f"cannot read {path}: {e}")
+            except ValueError as e:
+                raise TailFitError(f"malformed JSON in {path}: {e}")
+        cont, grid, pt, gt = docs
+
+        # eps_eff (lower bound), prefer continuum_operator_cert.numbers.epsilon_eff (or eps_eff)
+        eps_eff_s = coalesce(cont, EPS_EFF_PATHS, None)
+        if eps_eff_s is None:
+            raise TailFitError(
+                "could not locate epsilon_eff in "
+                "continuum_operator_cert.json (numbers.epsilon_eff / numbers.eps_eff)"
+            )
+        eps_eff_lo = _to_mpf(eps_eff_s, "epsilon_eff")
+
+        # grid_error upper bound (constant)
+        grid_hi_s = coalesce(grid, GRID_HI_PATHS, None)
+        if grid_hi_s is None:
+            raise TailFitError(
+                "could not locate grid bound "
+                "(grid_error_bound.bound_hi or numbers.grid_error_norm)."
+            )
+        grid_hi = _to_mpf(grid_hi_s, "grid bound")
+
+        # Prime tail T0 and env_T0_hi
+        T0_pt_s = coalesce(pt, PRIME_T0_PATHS, None)
+        env_pt_s = coalesce(pt, PRIME_ENV_PATHS, None)
+        if T0_pt_s is None or env_pt_s is None:
+            raise TailFitError(
+                "could not locate prime T0 and/or env_T0_hi "
+                "in prime_tail_envelope.json."
+            )
+        T0_pt = _to_mpf(T0_pt_s, "prime T0")
+        env_pt = _to_mpf(env_pt_s, "prime env_T0_hi")
+
+        # Gamma tail T0 and gamma_env_at_T0 (support v2.1 gamma_tails + legacy gamma_tail)
+        T0_gt_s = coalesce(gt, GAMMA_T0_PATHS, None)
+        env_gt_s = coalesce(gt, GAMMA_ENV_PATHS, None)
+        if T0_gt_s is None or env_gt_s is None:
+            raise TailFitError(
+                "could not locate gamma T0 and/or gamma_env_at_T0 "
+                "in gamma_tails/gamma_tail JSON."
+            )
+        T0_gt = _to_mpf(T0_gt_s, "gamma T0")
+        env_gt = _to_mpf(env_gt_s, "gamma_env_at_T0")
+
+        # Exponents
+        a_p = _to_mpf(Ap, "Ap")
+        a_g = _to_mpf(Ag, "Ag")
+        if a_p <= 0 or a_g <= 0:
+            raise TailFitError("exponents Ap, Ag must be positive.")
+
+        # Derive conservative C so that C/T^a >= env_T0_hi at T0
+        # => C = env_T0_hi * T0^a
+        C_prime = env_pt * (T0_pt ** a_p)
+        C_gamma = env_gt * (T0_gt ** a_g)
+
+        out = {
+            "kind": "analytic_tail_fit",
+            "inputs": {
+                "packet_dir": packet_dir,
+                "Ap": str(Ap),
+                "Ag": str(Ag),
+                "dps": str(dps),
+            },
+            "bounds": {
+                "eps_eff_lo": mp_str(eps_eff_lo),
+                "grid_error_hi": mp_str(grid_hi),
+                "prime_tail": {
+                    "C": mp_str(C_prime),
+                    "a": mp_str(a_p),
+                    "T0": mp_str(T0_pt),
+                    "env_T0_hi": mp_str(env_pt),
+                },
+                "gamma_tail": {
+                    "C": mp_str(C_gamma),
+                    "a": mp_str(a_g),
+                    "T0": mp_str(T0_gt),
+                    "env_T0_hi": mp_str(env_gt),
+                },
+            },
+            "meta": {
+                "tool": "analytic_tail_fit",
+                "dps": str(dps),
+                "created_utc": nows(),
+            },
+        }
+
+        numbers = {
+            "eps_eff_lo": eps_eff_lo,
+            "grid_hi": grid_hi,
+            "C_prime": C_prime,
+            "a_p": a_p,
+            "env_pt": env_pt,
+            "T0_pt": T0_pt,
+            "C_gamma": C_gamma,
+            "a_g": a_g,
+            "env_gt": env_gt,
+            "T0_gt": T0_gt,
+        }
+        return out, numbers
+
+
+def read_manifest(path: str):
+    """One packet directory per line; blank lines and '#' comments are skipped."""
+    with open(path, "r", encoding="utf-8") as f:
+        return [
+            ln.strip()
+            for ln in f
+            if ln.strip() and not ln.lstrip().startswith("#")
+        ]
+
+
+def read_batch(path: str):
+    """
+    JSONL batch file: one object per line with either "packet_dir" or all of
+    INPUT_KEYS (explicit paths override the packet's), plus optional "out",
+    "Ap" and "Ag". Blank lines and '#' comments are skipped.
+    """
+    records = []
+    with open(path, "r", encoding="utf-8") as f:
+        for lineno, ln in enumerate(f, 1):
+            if not ln.strip() or ln.lstrip().startswith("#"):
+                continue
+            try:
+                rec = json.loads(ln)
+            except ValueError as e:
+                raise TailFitError(f"{path}:{lineno}: invalid JSON ({e})")
+            if not isinstance(rec, dict):
+                raise TailFitError(f"{path}:{lineno}: expected a JSON object")
+            records.append(rec)
+    return records
+
+
+def fit_record(rec: Dict[str, Any], Ap: str, Ag: str, dps: int) -> str:
+    # Paths must be strings: an int would reach open() as a file descriptor.
+    for key in ("packet_dir", "out") + INPUT_KEYS:
+        if key in rec and not (isinstance(rec[key], str) and rec[key]):
+            raise TailFitError(f"batch record field {key!r} must be a non-empty string")
+    pkt = rec.get("packet_dir")
+    paths = packet_paths(pkt) if pkt else {}
+    paths.update({k: rec[k] for k in INPUT_KEYS if k in rec})
+    missing = [k for k in INPUT_KEYS if k not in paths]
+    if missing:
+        raise TailFitError(f"batch record needs packet_dir or {', '.join(missing)}")
+    out_path = rec.get("out") or (pkt and os.path.join(pkt, "analytic_tail_fit.json"))
+    if not out_path:
+        raise TailFitError("batch record without packet_dir needs \"out\"")
+    out = fit_one(paths, str(rec.get("Ap", Ap)), str(rec.get("Ag", Ag)), dps, pkt)
+    write_fit(out, out_path)
+    return out_path
+
+
+def run_manifest(args) -> int:
+    if args.batch:
+        try:
+            records = read_batch(args.batch)
+        except TailFitError as e:
+            print(f"[analytic_tail_fit] ERROR: {e}", file=sys.stderr)
+            return 1
+        items = [(rec.get("packet_dir") or rec.get("out") or "?", rec) for rec in records]
+
+        def fit(rec):
+            return fit_record(rec, args.Ap, args.Ag, args.dps)
+
+    else:
+        items = [(pkt, pkt) for pkt in read_manifest(args.manifest)]
+
+        def fit(pkt):
+            return fit_packet(pkt, args.Ap, args.Ag, args.dps)[0]
+
+    def job(item):
+        name, arg = item
+        try:
+            return name, fit(arg), None
+        except TailFitError as e:
+            return name, None, str(e)
+
+    # Work is dominated by file I/O; threads overlap the reads.
+    with ThreadPoolExecutor(max_workers=args.threads) as ex:
+        results = list(ex.map(job, items))
+
+    n_fail = 0
+    for pkt, out_path, err in results:
+        if err is None:
+            print(f"[analytic_tail_fit] wrote {out_path}")
+        else:
+            n_fail += 1
+            print(f"[analytic_tail_fit] ERROR: {pkt}: {err}", file=sys.stderr)
+    mode = "batch" if args.batch else "manifest"
+    print(f"[analytic_tail_fit] {mode}: {len(results) - n_fail}/{len(results)} packets ok")
+    return 1 if n_fail else 0
+
+
 def main():
     ap = argparse.ArgumentParser(
         description="Fit analytic 1/T^a tail models to numeric gamma/prime tails."
     )
-    ap.add_argument(
+    src = ap.add_mutually_exclusive_group(required=True)
+    src.add_argument(
         "--packet-dir",
         dest="packet_dir",
-        required=True,
         help="Path to PROOF_PACKET directory.",
     )
+    src.add_argument(
+        "--manifest",
+        default=None,
+        help="Text file listing one packet-dir per line; each is fitted and "
+        "written to <packet-dir>/analytic_tail_fit.json.",
+    )
+    src.add_argument(
+        "--batch",
+        default=None,
+        help="JSONL file, one fit per line: {\"packet_dir\": ...} and/or explicit "
+        "input paths (continuum_operator_cert, grid_error_bound, "
+        "prime_tail_envelope, gamma_tails), optional out/Ap/Ag.",
+    )
     ap.add_argument(
         "--Ap",
         type=str,
@@ -69,174 +379,37 @@ def main():
         default=220,
         help="Decimal precision for mpmath.",
     )
+    ap.add_argument(
+        "--threads",
+        type=int,
+        default=None,
+        help="Worker threads for --manifest/--batch (default: ThreadPoolExecutor default).",
+    )
     args = ap.parse_args()
 
     mp.dps = args.dps
 
-    pkt = args.packet_dir
-    out_path = args.out or os.path.join(pkt, "analytic_tail_fit.json")
-
-    # Required files (relative to packet-dir)
-    p_cont = os.path.join(pkt, "continuum_operator_cert.json")
-    p_grid = os.path.join(pkt, "grid_error_bound.json")
-    p_pt = os.path.join(pkt, "prime_tail_envelope.json")
-
-    # Gamma tails: prefer v2.1 gamma_tails.json, fall back to legacy gamma_tail.json
-    p_gt_v21 = os.path.join(pkt, "gamma_tails.json")
-    p_gt_legacy = os.path.join(pkt, "gamma_tail.json")
-    if os.path.exists(p_gt_v21):
-        p_gt = p_gt_v21
-    else:
-        p_gt = p_gt_legacy
+    if args.manifest or args.batch:
+        if args.out:
+            ap.error("--out cannot be combined with --manifest/--batch")
+        sys.exit(run_manifest(args))
 
     try:
-        cont = load_json(p_cont)
-        grid = load_json(p_grid)
-        pt = load_json(p_pt)
-        gt = load_json(p_gt)
-    except FileNotFoundError as e:
-        print(f"[analytic_tail_fit] ERROR: missing file: {e}", file=sys.stderr)
-        sys.exit(1)
-
-    # eps_eff (lower bound), prefer continuum_operator_cert.numbers.epsilon_eff (or eps_eff)
-    eps_eff_s = coalesce(
-        cont,
-        [["numbers", "epsilon_eff"], ["numbers", "eps_eff"]],
-        None,
-    )
-    if eps_eff_s is None:
-        print(
-            "[analytic_tail_fit] ERROR: could not locate epsilon_eff in "
-            "continuum_operator_cert.json (numbers.epsilon_eff / numbers.eps_eff)",
-            file=sys.stderr,
-        )
-        sys.exit(1)
-    eps_eff_lo = mp.mpf(str(eps_eff_s))
-
-    # grid_error upper bound (constant)
-    grid_hi_s = coalesce(
-        grid,
-        [["grid_error_bound", "bound_hi"], ["numbers", "grid_error_norm"]],
-        None,
-    )
-    if grid_hi_s is None:
-        print(
-            "[analytic_tail_fit] ERROR: could not locate grid bound "
-            "(grid_error_bound.bound_hi or numbers.grid_error_norm).",
-            file=sys.stderr,
-        )
-        sys.exit(1)
-    grid_hi = mp.mpf(str(grid_hi_s))
-
-    # Prime tail T0 and env_T0_hi
-    T0_pt_s = coalesce(
-        pt,
-        [["inputs", "T0"], ["T0"], ["prime_tail", "T0"]],
-        None,
-    )
-    env_pt_s = coalesce(
-        pt,
-        [
-            ["prime_tail", "env_T0_hi"],
-            ["prime_tail_envelope", "env_T0_hi"],
-            ["numbers", "prime_tail_norm"],
-        ],
-        None,
-    )
-    if T0_pt_s is None or env_pt_s is None:
-        print(
-            "[analytic_tail_fit] ERROR: could not locate prime T0 and/or env_T0_hi "
-            "in prime_tail_envelope.json.",
-            file=sys.stderr,
-        )
+        out_path, n = fit_packet(args.packet_dir, args.Ap, args.Ag, args.dps, args.out)
+    except TailFitError as e:
+        print(f"[analytic_tail_fit] ERROR: {e}", file=sys.stderr)
         sys.exit(1)
-    T0_pt = mp.mpf(str(T0_pt_s))
-    env_pt = mp.mpf(str(env_pt_s))
-
-    # Gamma tail T0 and gamma_env_at_T0 (support v2.1 gamma_tails + legacy gamma_tail)
-    T0_gt_s = coalesce(
-        gt,
-        [["inputs", "T0"], ["T0"], ["gamma_tail", "T0"]],
-        None,
-    )
-    env_gt_s = coalesce(
-        gt,
-        [
-            ["gamma_tails", "gamma_env_at_T0"],
-            ["gamma_tail", "gamma_env_at_T0"],
-            ["gamma_env_at_T0"],
-        ],
-        None,
-    )
-    if T0_gt_s is None or env_gt_s is None:
-        print(
-            "[analytic_tail_fit] ERROR: could not locate gamma T0 and/or gamma_env_at_T0 "
-            "in gamma_tails/gamma_tail JSON.",
-            file=sys.stderr,
-        )
-        sys.exit(1)
-    T0_gt = mp.mpf(str(T0_gt_s))
-    env_gt = mp.mpf(str(env_gt_s))
-
-    # Exponents
-    a_p = mp.mpf(str(args.Ap))
-    a_g = mp.mpf(str(args.Ag))
-    if a_p <= 0 or a_g <= 0:
-        print(
-            "[analytic_tail_fit] ERROR: exponents Ap, Ag must be positive.",
-            file=sys.stderr,
-        )
-        sys.exit(1)
-
-    # Derive conservative C so that C/T^a >= env_T0_hi at T0
-    # => C = env_T0_hi * T0^a
-    C_prime = env_pt * (T0_pt ** a_p)
-    C_gamma = env_gt * (T0_gt ** a_g)
-
-    out = {
-        "kind": "analytic_tail_fit",
-        "inputs": {
-            "packet_dir": pkt,
-            "Ap": str(args.Ap),
-            "Ag": str(args.Ag),
-            "dps": str(args.dps),
-        },
-        "bounds": {
-            "eps_eff_lo": mp_str(eps_eff_lo),
-            "grid_error_hi": mp_str(grid_hi),
-            "prime_tail": {
-                "C": mp_str(C_prime),
-                "a": mp_str(a_p),
-                "T0": mp_str(T0_pt),
-                "env_T0_hi": mp_str(env_pt),
-            },
-            "gamma_tail": {
-                "C": mp_str(C_gamma),
-                "a": mp_str(a_g),
-                "T0": mp_str(T0_gt),
-                "env_T0_hi": mp_str(env_gt),
-            },
-        },
-        "meta": {
-            "tool": "analytic_tail_fit",
-            "dps": str(args.dps),
-            "created_utc": nows(),
-        },
-    }
-
-    with open(out_path, "w", encoding="utf-8", newline="\n") as f:
-        json.dump(out, f, indent=2, ensure_ascii=False)
 
     print(f"[analytic_tail_fit] wrote {out_path}")
-    print(f"  eps_eff_lo   = {eps_eff_lo}")
-    print(f"  grid_error_hi= {grid_hi}")
+    print(f"  eps_eff_lo   = {n['eps_eff_lo']}")
+    print(f"  grid_error_hi= {n['grid_hi']}")
     print(
-        f"  prime: C={C_prime}  a={a_p}  "
-        f"(from env_T0_hi={env_pt} @ T0={T0_pt})"
+        f"  prime: C={n['C_prime']}  a={n['a_p']}  "
+        f"(from env_T0_hi={n['env_pt']} @ T0={n['T0_pt']})"
     )
     print(
-        f"  gamma: C={C_gamma}  a={a_g}  "
-        f"(from env_T0_hi={env_gt} @ T0={T0_gt})"
+        f"  gamma: C={n['C_gamma']}  a={n['a_g']}  "
+        f"(from env_T0_hi={n['env_gt']} @ T0={n['T0_gt']})"
     )
 
 
@@ -13,8 +13,23 @@ CLI (normalized v2.1):
   --bands           : path to bands JSON
   --out             : output JSON path
   --dps             : decimal precision for mpmath
-  --tol             : subdivision tolerance for band_min_bounds
+  --tol             : subdivision tolerance for band_min_bounds (relative to the
+                      band minimum: tol*(|best_hi|+tol))
   --max-parts       : maximum number of sub-intervals
+  --screen-batch    : float64 screening batch size for band_min_bounds
+                      (0 disables screening; requires numpy)
+  --fast            : use the Numba-compiled float64 screening kernel
+                      (optional; requires numba)
+  --screen          : screening arithmetic: f64 (numpy) | mpfr (gmpy2 at
+                      ~4*dps bits; keeps screening below float64 resolution)
+  --workers         : processes for per-band certification
+                      (default os.cpu_count(); 1 = in-process)
+  --subdivide       : bound each band by interval subdivision instead of the
+                      endpoint (unimodality) certificate; --tol, --max-parts,
+                      --screen-batch, --fast, --screen and --workers only
+                      apply with --subdivide and are rejected without it
+  --backend         : interval backend: auto | flint | mpmath (default auto;
+                      auto uses python-flint Arb balls when importable)
   --tqdm            : show per-band progress (optional)
 
 JSON (normalized v2.1 pattern):
@@ -59,6 +74,7 @@ JSON (normalized v2.1 pattern):
     "meta": {
       "tool": "band_cert",
       "dps": <int>,
+      "backend": "flint" | "mpmath",
       "sha256": "<digest>"
     }
   }
@@ -66,13 +82,17 @@ JSON (normalized v2.1 pattern):
 All real-valued numeric fields are serialized as strings.
 """
 
+import os
+import re
 import sys
+import math
 import json
 import argparse
-import io
 import pathlib
 import hashlib
 from typing import List, Tuple, Dict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from datetime import datetime, timezone
 
 try:
@@ -88,6 +108,26 @@ try:
 except Exception:
     _tqdm = None
 
+try:
+    import flint as _flint
+except Exception:
+    _flint = None
+
+try:
+    import numpy as _np
+except Exception:
+    _np = None
+
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
+
+try:
+    import gmpy2 as _gmpy2
+except Exception:
+    _gmpy2 = None
+
 
 # --- Generic utilities -----------------------------------------------------
 
@@ -96,20 +136,45 @@ def fail(msg: str):
     sys.exit(f"[error] {msg}")
 
 
+def loads_json(data: bytes):
+    # orjson rejects a few inputs the stdlib accepts (NaN, >64-bit integers);
+    # defer to json for those so behaviour matches the stdlib reader.
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
 def read_json(path: str):
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(path, "rb", buffering=65536) as f:
+            return loads_json(f.read())
     except Exception as e:
         fail(f"failed to read JSON {path}: {e}")
 
 
-def to_mpf(x):
+# mpf values are immutable, so conversions are memoized per (value, precision);
+# decimal parsing/formatting at dps~220 is the expensive part.
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _to_mpf_cached(x, prec: int):
     return mp.mpf(str(x))
 
 
+@lru_cache(maxsize=4096, typed=True)
+def _mp_str_cached(x, dps: int) -> str:
+    return mp.nstr(mp.mpf(x), n=dps, strip_zeros=False)
+
+
+def to_mpf(x):
+    return _to_mpf_cached(x, mp.prec)
+
+
 def mp_str(x) -> str:
-    return mp.nstr(mp.mpf(x), n=mp.dps, strip_zeros=False)
+    return _mp_str_cached(x, mp.dps)
 
 
 def now_utc_iso() -> str:
@@ -121,12 +186,36 @@ def now_utc_iso() -> str:
     )
 
 
+_SHA_PLACEHOLDER = "<SHA256_PLACEHOLDER>"
+
+
+def dumps_canonical(obj) -> bytes:
+    """
+    Sorted-key, indent=2, UTF-8 JSON bytes with a trailing newline. Uses
+    orjson when importable (byte-identical to the stdlib form for the
+    string/int/bool payloads written here), else the stdlib encoder.
+    """
+    if _orjson is not None:
+        return _orjson.dumps(
+            obj,
+            option=_orjson.OPT_INDENT_2
+            | _orjson.OPT_SORT_KEYS
+            | _orjson.OPT_APPEND_NEWLINE,
+        )
+    js = json.dumps(obj, sort_keys=True, ensure_ascii=False, indent=2)
+    return (js + "\n").encode("utf-8")
+
+
 def write_json(obj: Dict, path: str):
     """
     Write JSON with deterministic sha256 stored under meta.sha256.
 
     The sha256 is computed over the canonical serialized form
-    (sorted keys, UTF-8, indent=2).
+    (sorted keys, UTF-8, indent=2) without the meta.sha256 member.
+    The payload is serialized once with a placeholder digest; the hashed
+    form is those bytes with the placeholder member cut out, fed to sha256
+    as two memoryview slices and written as three, so the payload bytes are
+    never copied.
     """
     p = pathlib.Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
@@ -134,14 +223,27 @@ def write_json(obj: Dict, path: str):
     if "meta" not in obj or not isinstance(obj["meta"], dict):
         obj["meta"] = {}
 
-    js = json.dumps(obj, sort_keys=True, ensure_ascii=False, indent=2)
-    sha = hashlib.sha256(js.encode("utf-8")).hexdigest()
+    obj["meta"]["sha256"] = _SHA_PLACEHOLDER
+    raw = dumps_canonical(obj)
+    placeholder = _SHA_PLACEHOLDER.encode("ascii")
+    member = re.escape(b'"sha256": "' + placeholder + b'"')
+    m = re.compile(
+        rb"\n *" + member + rb",(?=\n)|,\n *" + member + rb"(?=\n)"
+    ).search(raw, 0, len(raw) - 1)
+    if m is None:
+        fail("internal error: could not locate meta.sha256 placeholder")
+    view = memoryview(raw)
+    h = hashlib.sha256(view[: m.start()])
+    h.update(view[m.end() : len(raw) - 1])
+    sha = h.hexdigest()
     obj["meta"]["sha256"] = sha
+    ph = raw.index(placeholder, m.start(), m.end())
 
     tmp = str(p) + ".tmp"
-    with io.open(tmp, "w", encoding="utf-8", newline="\n") as f:
-        json.dump(obj, f, indent=2, ensure_ascii=False, sort_keys=True)
-        f.write("\n")
+    with open(tmp, "wb", buffering=65536) as f:
+        f.write(view[:ph])
+        f.write(sha.encode("ascii"))
+        f.write(view[ph + len(placeholder) :])
     pathlib.Path(tmp).replace(p)
     print(f"[ok] band_cert -> {path} sha256={sha}")
 
@@ -149,7 +251,19 @@ def write_json(obj: Dict, path: str):
 # --- Window model (canonical sigma/k0 only) --------------------------------
 
 
-def make_window(window_js: Dict):
+def mpf_to_arb(x: mp.mpf):
+    """Exact conversion of an mpmath real to an Arb ball (binary mantissa/exponent)."""
+    man, exp = mp.mpf(x).man_exp
+    return _flint.arb((int(man), int(exp)))
+
+
+def arb_to_mpf(x) -> mp.mpf:
+    """Exact conversion of an exact Arb value (e.g. from .lower()/.upper())."""
+    man, exp = x.man_exp()
+    return mp.mpf((int(man), int(exp)))
+
+
+def make_window(window_js: Dict, backend: str = "auto"):
     """
     Expect a canonical window configuration of the form produced by window_gen:
 
@@ -168,6 +282,10 @@ def make_window(window_js: Dict):
 
     Either the top-level or the nested 'window' block may be present; both
     use canonical field names 'sigma' and 'k0'.
+
+    backend selects the interval evaluator: "flint" (Arb ball arithmetic,
+    C-backed), "mpmath" (mpmath.iv), or "auto" (flint when importable).
+    Both return rigorous enclosures; the returned backend name is recorded.
     """
     if not isinstance(window_js, dict):
         fail("window-config JSON must be an object")
@@ -192,11 +310,83 @@ def make_window(window_js: Dict):
     if k0 <= 0:
         fail("window k0 must be > 0")
 
+    if backend == "auto":
+        backend = "flint" if _flint is not None else "mpmath"
+    if backend == "flint" and _flint is None:
+        fail("--backend flint requested but python-flint is not importable")
+    if backend not in ("flint", "mpmath"):
+        fail(f"unknown interval backend {backend!r}")
+
+    if backend == "flint":
+        # Working precision matches mp.prec so Arb endpoints convert back exactly.
+        _flint.ctx.prec = mp.prec
+        # Reciprocal balls are hoisted so the kernel only multiplies.
+        inv_sigma2_b = 1 / mpf_to_arb(sigma) ** 2
+        inv_k02_b = 1 / mpf_to_arb(k0) ** 2
+        inv_sum_b = inv_sigma2_b + inv_k02_b
+        zero_b = _flint.arb(0)
+
+        def _arb_band(A, B, a, b):
+            # Both factors are monotone in x^2 (Gaussian decreasing, notch
+            # increasing), so the enclosure is formed from point balls at the
+            # extreme values of x^2, exactly as iv.exp does on endpoints. A
+            # single mid/rad ball over [a, b] would lose the x^2 dependency.
+            if a >= 0:
+                x_lo, x_hi = A, B
+            elif b <= 0:
+                x_lo, x_hi = -B, -A
+            else:
+                x_lo, x_hi = zero_b, (B if b >= -a else -A)
+            sq_lo = x_lo * x_lo
+            sq_hi = x_hi * x_hi
+            g_lo = (-(sq_hi * inv_sigma2_b)).exp()  # Gaussian envelope
+            g_hi = (-(sq_lo * inv_sigma2_b)).exp()
+            n_lo = 1 - (-(sq_lo * inv_k02_b)).exp()  # multiplicative notch
+            n_hi = 1 - (-(sq_hi * inv_k02_b)).exp()
+            # Over a band the product form is kept: its bounds are never
+            # wider than the fused difference (which decouples the exponents).
+            return g_lo * n_lo, g_hi * n_hi
+
+        def W_abs_arb_on(a: mp.mpf, b: mp.mpf):
+            A = mpf_to_arb(a)
+            if a == b:
+                # Point: fused W = exp(-x^2/sigma^2) - exp(-x^2(1/sigma^2 + 1/k0^2)),
+                # two exponentials instead of four.
+                sq = A * A
+                w = (-(sq * inv_sigma2_b)).exp() - (-(sq * inv_sum_b)).exp()
+                w_lo = w_hi = w
+            else:
+                w_lo, w_hi = _arb_band(A, mpf_to_arb(b), a, b)
+            if not (w_lo.is_finite() and w_hi.is_finite()):
+                return mp.mpf("0"), mp.inf
+            lo = arb_to_mpf(w_lo.lower())
+            hi = arb_to_mpf(w_hi.upper())
+            if lo < 0:
+                lo = mp.mpf("0")
+            if hi < 0:
+                hi = mp.mpf("0")
+            return lo, hi
+
+        return W_abs_arb_on, sigma, k0, mode, backend
+
+    # Enclosures of 1/sigma^2 and 1/k0^2, hoisted so the kernel only multiplies.
+    inv_sigma2_iv = 1 / iv.mpf(sigma) ** 2
+    inv_k02_iv = 1 / iv.mpf(k0) ** 2
+    inv_sum_iv = inv_sigma2_iv + inv_k02_iv
+
     def W_abs_iv_on(a: mp.mpf, b: mp.mpf):
         I = iv.mpf([a, b])
-        g = iv.exp(-(I / sigma) ** 2)  # Gaussian envelope
-        n = 1 - iv.exp(-(I / k0) ** 2)  # multiplicative notch
-        w = g * n
+        # iv squaring is already sign-aware (two directed-rounded products);
+        # square once and share it between both factors.
+        sq = I ** 2
+        g = iv.exp(-sq * inv_sigma2_iv)  # Gaussian envelope
+        if a == b:
+            # Point: fused g*(1 - n) = g - exp(-x^2(1/sigma^2 + 1/k0^2)).
+            # Over a band the product below is never wider, so it is kept there.
+            w = g - iv.exp(-sq * inv_sum_iv)
+        else:
+            n = 1 - iv.exp(-sq * inv_k02_iv)  # multiplicative notch
+            w = g * n
         lo = mp.mpf(w.a if w.a is not None else 0)
         hi = mp.mpf(w.b if w.b is not None else 0)
         if lo < 0:
@@ -205,7 +395,149 @@ def make_window(window_js: Dict):
             hi = mp.mpf("0")
         return lo, hi
 
-    return W_abs_iv_on, sigma, k0, mode
+    return W_abs_iv_on, sigma, k0, mode, backend
+
+
+def _w_abs_f64_py(a_arr, b_arr, sigma, k0):
+    """Scalar-loop float64 envelope; compiled with Numba by _w_abs_f64_kernel."""
+    inv_s = 1.0 / sigma
+    inv_k = 1.0 / k0
+    n = a_arr.shape[0]
+    lo = _np.empty(n)
+    hi = _np.empty(n)
+    for i in range(n):
+        a = a_arr[i]
+        b = b_arr[i]
+        abs_a = abs(a)
+        abs_b = abs(b)
+        x_hi = max(abs_a, abs_b)
+        if a < 0.0 and b > 0.0:
+            x_lo = 0.0
+        else:
+            x_lo = min(abs_a, abs_b)
+        s_lo = x_lo * inv_s
+        s_hi = x_hi * inv_s
+        t_lo = x_lo * inv_k
+        t_hi = x_hi * inv_k
+        lo[i] = math.exp(-s_hi * s_hi) * -math.expm1(-t_lo * t_lo)
+        hi[i] = math.exp(-s_lo * s_lo) * -math.expm1(-t_hi * t_hi)
+    return lo, hi
+
+
+_w_abs_f64 = None
+
+
+def _w_abs_f64_kernel():
+    """
+    Lazily compile _w_abs_f64_py with @njit(cache=True, fastmath=True).
+    numba is only imported when --fast is requested; returns None if absent.
+    """
+    global _w_abs_f64
+    if _w_abs_f64 is None:
+        try:
+            from numba import njit
+        except Exception:
+            return None
+        _w_abs_f64 = njit(cache=True, fastmath=True)(_w_abs_f64_py)
+    return _w_abs_f64
+
+
+def make_envelope_f64(sigma: mp.mpf, k0: mp.mpf, fast: bool = False):
+    """
+    Non-rigorous float64 counterpart of W_abs_iv_on, vectorized over lists
+    of sub-interval endpoints (mpf); returns (lo, hi) lists of floats. Used
+    only to screen sub-intervals in band_min_bounds; every reported bound
+    still comes from W_abs_iv_on.
+
+    Both factors are monotone in x^2, so endpoint evaluation at the extreme
+    values of |x| gives the (approximate) range. Returns None without numpy.
+    With fast=True the Numba-compiled kernel (see _w_abs_f64_kernel) is
+    used instead of numpy array expressions.
+    """
+    if _np is None:
+        return None
+
+    sigma_f = float(sigma)
+    k0_f = float(k0)
+
+    if fast:
+        kernel = _w_abs_f64_kernel()
+        if kernel is None:
+            fail("--fast requested but numba is not importable")
+
+        def envelope_jit(a_list, b_list):
+            lo, hi = kernel(
+                _np.array([float(x) for x in a_list]),
+                _np.array([float(x) for x in b_list]),
+                sigma_f,
+                k0_f,
+            )
+            return lo.tolist(), hi.tolist()
+
+        envelope_jit.rel_slack = 1e-12
+        return envelope_jit
+
+    def envelope(a_list, b_list):
+        a_arr = _np.array([float(x) for x in a_list])
+        b_arr = _np.array([float(x) for x in b_list])
+        abs_a = _np.abs(a_arr)
+        abs_b = _np.abs(b_arr)
+        straddle = (a_arr < 0) & (b_arr > 0)
+        x_lo = _np.where(straddle, 0.0, _np.minimum(abs_a, abs_b))
+        x_hi = _np.maximum(abs_a, abs_b)
+        g_lo = _np.exp(-((x_hi / sigma_f) ** 2))
+        g_hi = _np.exp(-((x_lo / sigma_f) ** 2))
+        n_lo = -_np.expm1(-((x_lo / k0_f) ** 2))
+        n_hi = -_np.expm1(-((x_hi / k0_f) ** 2))
+        return (g_lo * n_lo).tolist(), (g_hi * n_hi).tolist()
+
+    envelope.rel_slack = 1e-12
+    return envelope
+
+
+def mpf_to_mpfr(x):
+    man, exp = mp.mpf(x).man_exp
+    return _gmpy2.mul_2exp(_gmpy2.mpfr(man), int(exp))
+
+
+def make_envelope_mpfr(sigma: mp.mpf, k0: mp.mpf):
+    """
+    Screening envelope in gmpy2/MPFR at ~4*dps bits (W_abs_gmpy_on applied
+    over lists of endpoints). Same monotone endpoint formulas as
+    make_envelope_f64, but resolves sub-intervals far below float64
+    spacing, so deep refinement near the minimizer is screened in C rather
+    than in mpmath.iv. Not rigorous; returns None without gmpy2.
+    """
+    if _gmpy2 is None:
+        return None
+
+    _gmpy2.get_context().precision = 4 * mp.dps
+    inv_s = 1 / mpf_to_mpfr(sigma)
+    inv_k = 1 / mpf_to_mpfr(k0)
+    exp = _gmpy2.exp
+    expm1 = _gmpy2.expm1
+
+    def W_abs_gmpy_on(a: mp.mpf, b: mp.mpf):
+        A = mpf_to_mpfr(a)
+        B = mpf_to_mpfr(b)
+        abs_a = abs(A)
+        abs_b = abs(B)
+        x_hi = max(abs_a, abs_b)
+        x_lo = 0 if (A < 0 < B) else min(abs_a, abs_b)
+        s_lo = x_lo * inv_s
+        s_hi = x_hi * inv_s
+        t_lo = x_lo * inv_k
+        t_hi = x_hi * inv_k
+        lo = exp(-s_hi * s_hi) * -expm1(-t_lo * t_lo)
+        hi = exp(-s_lo * s_lo) * -expm1(-t_hi * t_hi)
+        return lo, hi
+
+    def envelope(a_list, b_list):
+        pairs = [W_abs_gmpy_on(a, b) for a, b in zip(a_list, b_list)]
+        return [p[0] for p in pairs], [p[1] for p in pairs]
+
+    envelope.rel_slack = 2.0 ** (32 - 4 * mp.dps)
+    return envelope
 
 
 # --- Band parsing ----------------------------------------------------------
@@ -259,47 +591,250 @@ def parse_bands_generic(bands_js) -> List[Tuple[mp.mpf, mp.mpf, str]]:
 # --- Interval refinement ---------------------------------------------------
 
 
+def scaled_tol(tol, best_hi):
+    """
+    Width tolerance relative to the current best upper bound on the minimum,
+    tol * (|best_hi| + tol), so O(1) margins stop at ~tol while tiny margins
+    are still resolved to ~tol relative accuracy (never below tol**2).
+    Falls back to tol while best_hi is not finite (e.g. an unbounded first
+    enclosure), so the search keeps splitting.
+    """
+    if not mp.isfinite(best_hi):
+        return tol
+    return tol * (abs(best_hi) + tol)
+
+
 def band_min_bounds(
-    W_abs_iv_on, L: mp.mpf, R: mp.mpf, max_parts=16384, tol=mp.mpf("1e-30")
+    W_abs_iv_on,
+    L: mp.mpf,
+    R: mp.mpf,
+    max_parts=16384,
+    tol=mp.mpf("1e-30"),
+    screen=None,
+    batch=4096,
 ):
     """
     Returns (lo, hi) bounds for min_{f in [L,R]} |W(f)| using interval subdivision.
+
+    Widths are compared against scaled_tol(tol, best_hi), i.e. tol is
+    relative to the size of the minimum. Sub-intervals whose certified lower bound is not below the best upper
+    bound found so far are pruned (branch and bound); they cannot change
+    either returned bound.
+
+    With a screening envelope (make_envelope_f64 / make_envelope_mpfr) the
+    refinement is screened in float64 or MPFR: sub-intervals are popped in batches of up to `batch`, and one
+    whose float64 width clearly exceeds tol is split without an mpmath
+    evaluation (the baseline would split it anyway; its children tighten
+    best_hi at least as well, and best_lo is fixed by the certified root).
+    Intervals whose float64 lower estimate exceeds the smallest float64
+    upper estimate are left unsplit, and intervals below float64
+    resolution fall through to W_abs_iv_on.
     """
     from heapq import heappush, heappop
 
+    if screen is not None and batch > 0:
+        return _band_min_bounds_screened(
+            W_abs_iv_on, L, R, max_parts, tol, screen, batch
+        )
+
     pq = []
+    best_lo = mp.inf
+    best_hi = mp.inf
 
     def push(a, b):
         lo, hi = W_abs_iv_on(a, b)
-        heappush(pq, (float(lo), a, b, lo, hi))
+        # A sub-interval whose lower bound is already >= best_hi can improve
+        # neither bound (hi >= the true minimum on it >= lo), so drop it.
+        if lo < best_hi:
+            heappush(pq, (float(lo), a, b, lo, hi))
 
     push(L, R)
-    best_lo = mp.inf
-    best_hi = mp.inf
     parts = 1
 
     while pq and parts <= max_parts:
         _, a, b, lo, hi = heappop(pq)
+        if lo >= best_hi:
+            # The heap is ordered by lo, so nothing left can do better.
+            break
         if lo < best_lo:
             best_lo = lo
         if hi < best_hi:
             best_hi = hi
-        if hi - lo <= tol:
+        local_tol = scaled_tol(tol, best_hi)
+        if hi - lo <= local_tol:
             pass
         else:
             mid = (a + b) / 2
             push(a, mid)
             push(mid, b)
             parts += 1
-        if best_hi - best_lo <= tol:
+        if best_hi - best_lo <= local_tol:
+            break
+
+    return best_lo, best_hi
+
+
+def band_min_bounds_unimodal(W_abs_iv_on, L: mp.mpf, R: mp.mpf):
+    """
+    Returns (lo, hi) bounds for min_{f in [L,R]} |W(f)| from endpoint
+    enclosures, without subdivision.
+
+    With u = f^2, alpha = 1/sigma^2, beta = 1/k0^2 the window is
+    W = exp(-alpha u) - exp(-(alpha+beta) u), and
+
+      dW/du = exp(-alpha u) * ((alpha+beta) exp(-beta u) - alpha),
+
+    whose bracket is strictly decreasing in u. W therefore rises then falls
+    in |f| (single interior maximum, no interior minimum), so the minimum
+    over a band is attained at an endpoint, or is W(0) = 0 when the band
+    contains 0. The bounds are point enclosures from W_abs_iv_on, hence
+    rigorous and as tight as the working precision.
+    """
+    if L <= 0 <= R:
+        return W_abs_iv_on(mp.mpf("0"), mp.mpf("0"))
+    lo_L, hi_L = W_abs_iv_on(L, L)
+    lo_R, hi_R = W_abs_iv_on(R, R)
+    return min(lo_L, lo_R), min(hi_L, hi_R)
+
+
+def _band_min_bounds_screened(W_abs_iv_on, L, R, max_parts, tol, screen, batch):
+    from heapq import heappush, heappop, nsmallest
+
+    # relative screening error on top of 10*tol before a width counts as
+    # "clearly" > tol; set by the envelope maker to match its precision
+    rel_slack = getattr(screen, "rel_slack", 1e-12)
+    best_lo, best_hi = W_abs_iv_on(L, R)
+    local_tol = scaled_tol(tol, best_hi)
+    tol_f = float(local_tol)
+    if best_hi - best_lo <= local_tol:
+        return best_lo, best_hi
+
+    pq = []  # (lo_f, a, b, hi_f); bounds not yet certified
+    parts = 1
+    split_a = [L]
+    split_b = [R]
+    hi_floor = float("inf")  # smallest screened upper estimate seen so far
+
+    while True:
+        if split_a:
+            mids = [(a + b) / 2 for a, b in zip(split_a, split_b)]
+            ca = split_a + mids
+            cb = mids + split_b
+            lo_f, hi_f = screen(ca, cb)
+            for a, b, lf, hf in zip(ca, cb, lo_f, hi_f):
+                heappush(pq, (lf, a, b, hf))
+                if hf < hi_floor:
+                    hi_floor = hf
+            split_a = []
+            split_b = []
+
+        # Entries above hi_floor cannot hold the minimizer (keeps best-first
+        # focus when a whole batch is popped at once).
+        cutoff = hi_floor * (1 + rel_slack) + tol_f
+        if not pq or parts > max_parts or pq[0][0] > cutoff:
             break
 
+        for _ in range(min(batch, len(pq))):
+            if pq[0][0] > cutoff or parts > max_parts:
+                break
+            lo_f, a, b, hi_f = heappop(pq)
+            if hi_f - lo_f > 10 * tol_f + rel_slack * hi_f:
+                split_a.append(a)
+                split_b.append(b)
+                parts += 1
+                continue
+            lo, hi = W_abs_iv_on(a, b)
+            if lo < best_lo:
+                best_lo = lo
+            if hi < best_hi:
+                best_hi = hi
+            if hi - lo > local_tol:
+                split_a.append(a)
+                split_b.append(b)
+                parts += 1
+
+        local_tol = scaled_tol(tol, best_hi)
+        tol_f = float(local_tol)
+        if best_hi - best_lo <= local_tol:
+            return best_lo, best_hi
+
+    # Budget exhausted: certify the leaves that look best in float64.
+    if pq:
+        hi_min = min(e[3] for e in pq)
+        for _, a, b, hi_f in nsmallest(batch, pq, key=lambda e: e[3]):
+            if hi_f > hi_min * (1 + rel_slack) + tol_f:
+                break
+            lo, hi = W_abs_iv_on(a, b)
+            if lo < best_lo:
+                best_lo = lo
+            if hi < best_hi:
+                best_hi = hi
+
     return best_lo, best_hi
 
 
+# --- Per-band workers ------------------------------------------------------
+
+_worker_state = {}
+
+
+def _init_band_worker(
+    dps: int,
+    window_js: Dict,
+    backend: str,
+    fast: bool,
+    subdivide: bool,
+    screen: str = "f64",
+):
+    """
+    Pool initializer: set working precision and rebuild the window kernels
+    once per process (closures are not picklable).
+    """
+    mp.dps = int(dps)
+    iv.prec = mp.prec
+    W_abs_iv_on, sigma, k0, _, _ = make_window(window_js, backend)
+    _worker_state["W_abs_iv_on"] = W_abs_iv_on
+    if screen == "mpfr":
+        envelope = make_envelope_mpfr(sigma, k0)
+        if envelope is None:
+            fail("--screen mpfr requested but gmpy2 is not importable")
+    else:
+        envelope = make_envelope_f64(sigma, k0, fast=fast)
+    _worker_state["screen"] = envelope
+    _worker_state["subdivide"] = bool(subdivide)
+
+
+def _cert_one_band(job):
+    L, R, label, tol, max_parts, batch = job
+    if not _worker_state["subdivide"]:
+        lo, hi = band_min_bounds_unimodal(_worker_state["W_abs_iv_on"], L, R)
+        return L, R, label, lo, hi
+    lo, hi = band_min_bounds(
+        _worker_state["W_abs_iv_on"],
+        L,
+        R,
+        max_parts=max_parts,
+        tol=tol,
+        screen=_worker_state["screen"],
+        batch=batch,
+    )
+    return L, R, label, lo, hi
+
+
 # --- Main ------------------------------------------------------------------
 
 
+# Options that only tune the subdivision search, as (flag, argparse dest).
+SUBDIVIDE_ONLY_OPTIONS = (
+    ("--tol", "tol"),
+    ("--max-parts", "max_parts"),
+    ("--screen-batch", "screen_batch"),
+    ("--fast", "fast"),
+    ("--screen", "screen"),
+    ("--workers", "workers"),
+)
+
+
 def main():
     ap = argparse.ArgumentParser(
         description="Rigorous band certificate using interval arithmetic."
@@ -329,13 +864,51 @@ def main():
         "--tol",
         type=str,
         default="1e-30",
-        help="Subdivision tolerance for band_min_bounds.",
+        help="Subdivision tolerance for band_min_bounds, relative to the band minimum "
+        "(widths are compared against tol*(|best_hi|+tol)). --subdivide only.",
     )
     ap.add_argument(
         "--max-parts",
         type=int,
         default=16384,
-        help="Maximum number of sub-intervals per band.",
+        help="Maximum number of sub-intervals per band. --subdivide only.",
+    )
+    ap.add_argument(
+        "--screen-batch",
+        type=int,
+        default=4096,
+        help="Batch size for float64 screening of sub-intervals (0 disables; needs numpy). "
+        "--subdivide only.",
+    )
+    ap.add_argument(
+        "--fast",
+        action="store_true",
+        help="Use the Numba-compiled float64 screening kernel (requires numba). "
+        "--subdivide only.",
+    )
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Worker processes for per-band certification (0: os.cpu_count(); 1: in-process). "
+        "--subdivide only; the endpoint certificate always runs in-process.",
+    )
+    ap.add_argument(
+        "--subdivide",
+        action="store_true",
+        help="Bound bands by interval subdivision instead of the endpoint certificate.",
+    )
+    ap.add_argument(
+        "--screen",
+        choices=["f64", "mpfr"],
+        default="f64",
+        help="Screening arithmetic for --subdivide: float64 (numpy/numba) or gmpy2 MPFR.",
+    )
+    ap.add_argument(
+        "--backend",
+        choices=["auto", "flint", "mpmath"],
+        default="auto",
+        help="Interval backend (auto: python-flint Arb if importable, else mpmath.iv).",
     )
     ap.add_argument(
         "--tqdm",
@@ -344,50 +917,105 @@ def main():
     )
     args = ap.parse_args()
 
+    if not args.subdivide:
+        # These only tune the subdivision search; reject them rather than
+        # silently ignoring them.
+        given = [
+            opt
+            for opt, dest in SUBDIVIDE_ONLY_OPTIONS
+            if getattr(args, dest) != ap.get_default(dest)
+        ]
+        if given:
+            ap.error(f"{', '.join(given)} require --subdivide")
+
     mp.dps = int(args.dps)
     try:
-        _ = iv
+        # iv keeps its own context; evaluate at the same working precision.
+        iv.prec = mp.prec
     except Exception:
         fail("mpmath interval arithmetic unavailable (iv)")
 
     window_js = read_json(args.window_config)
     bands_js = read_json(args.bands)
 
-    W_abs_iv_on, sigma, k0, mode = make_window(window_js)
+    _, sigma, k0, mode, backend = make_window(window_js, args.backend)
     bands = parse_bands_generic(bands_js)
     tol = mp.mpf(str(args.tol))
 
-    per_band = []
+    # Per-band results are kept column-wise and formatted after the loop.
+    labels, lefts, rights, los, his = [], [], [], [], []
     glo_lo = mp.inf
     glo_hi = mp.inf
 
-    iterator = enumerate(bands)
+    jobs = [
+        (L, R, label, tol, int(args.max_parts), int(args.screen_batch))
+        for (L, R, label) in bands
+    ]
+    init_args = (
+        int(args.dps),
+        window_js,
+        backend,
+        bool(args.fast),
+        bool(args.subdivide),
+        args.screen,
+    )
+    # The endpoint certificate is a few point enclosures per band, far cheaper
+    # than starting worker processes.
+    workers = (int(args.workers) or (os.cpu_count() or 1)) if args.subdivide else 1
+    workers = max(1, min(workers, len(jobs)))
+
+    executor = None
+    if workers > 1:
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_band_worker,
+            initargs=init_args,
+        )
+        results = executor.map(_cert_one_band, jobs)
+    else:
+        _init_band_worker(*init_args)
+        results = map(_cert_one_band, jobs)
+
+    iterator = results
     if args.tqdm and _tqdm is not None:
         iterator = _tqdm(
             iterator,
-            total=len(bands),
+            total=len(jobs),
             desc="[band_cert] bands",
             leave=False,
         )
 
-    for idx, (L, R, label) in iterator:
-        lo, hi = band_min_bounds(
-            W_abs_iv_on, L, R, max_parts=int(args.max_parts), tol=tol
-        )
-        per_band.append(
-            {
-                "label": label,
-                "left": mp_str(L),
-                "right": mp_str(R),
-                "min_abs_lo": mp_str(lo),
-                "min_abs_hi": mp_str(hi),
-            }
-        )
+    for L, R, label, lo, hi in iterator:
+        labels.append(label)
+        lefts.append(L)
+        rights.append(R)
+        los.append(lo)
+        his.append(hi)
         if lo < glo_lo:
             glo_lo = lo
         if hi < glo_hi:
             glo_hi = hi
 
+    if executor is not None:
+        executor.shutdown()
+
+    per_band = [
+        {
+            "label": label,
+            "left": left,
+            "right": right,
+            "min_abs_lo": lo,
+            "min_abs_hi": hi,
+        }
+        for label, left, right, lo, hi in zip(
+            labels,
+            map(mp_str, lefts),
+            map(mp_str, rights),
+            map(mp_str, los),
+            map(mp_str, his),
+        )
+    ]
+
     PASS_bool = bool(glo_lo > 0)
     PASS_str = "PASS" if PASS_bool else "FAIL"
 
@@ -433,6 +1061,7 @@ def main():
         "meta": {
             "tool": "band_cert",
             "dps": int(args.dps),
+            "backend": backend,
         },
     }
 
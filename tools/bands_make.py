@@ -21,6 +21,8 @@ CLI (normalized v2.1):
   --inner-right      : optional inner band right
   --outer-left       : optional outer band left
   --outer-right      : optional outer band right
+  --compact          : write canonical compact JSON (the hashed form) instead
+                       of indent=2; same content and sha256
 
 JSON (v2.1-style, non-certificate artifact):
   {
@@ -73,11 +75,16 @@ import os
 import sys
 import time
 import platform
-import multiprocessing
+from functools import lru_cache
 from pathlib import Path
 from decimal import Decimal as D, getcontext
 from datetime import datetime, timezone
 
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
+
 
 def now_utc_iso() -> str:
     return (
@@ -88,22 +95,79 @@ def now_utc_iso() -> str:
     )
 
 
+_SHA_PLACEHOLDER = "<SHA256_PLACEHOLDER>"
+
+
+def canonical_bytes(obj) -> bytes:
+    """
+    Canonical JSON serialization (sorted keys, no pretty-printing), UTF-8.
+    orjson, when importable, emits the same bytes for these str/int/list
+    payloads; anything it cannot encode goes through the stdlib.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj, option=_orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(
+        obj, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def pretty_bytes(obj) -> bytes:
+    """indent=2, sorted-key UTF-8 JSON (the default on-disk layout)."""
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(
+                obj, option=_orjson.OPT_INDENT_2 | _orjson.OPT_SORT_KEYS
+            )
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2, sort_keys=True, ensure_ascii=False).encode(
+        "utf-8"
+    )
+
+
 def sha256_canonical(obj) -> str:
     """
     Compute sha256 over a canonical JSON serialization (sorted keys, no
     pretty-printing). Used for meta.sha256.
     """
-    blob = json.dumps(
-        obj, sort_keys=True, ensure_ascii=False, separators=(",", ":")
-    ).encode("utf-8")
-    return hashlib.sha256(blob).hexdigest()
+    return hashlib.sha256(canonical_bytes(obj)).hexdigest()
 
 
-def write_json(path, payload):
+def canonical_bytes_with_sha(payload) -> bytes:
+    """
+    Canonical bytes of payload with meta.sha256 filled in, from a single
+    serialization: the payload is encoded once with a placeholder digest,
+    the hash covers those bytes with the placeholder member (and one
+    adjoining comma) cut out -- i.e. sha256_canonical of the payload
+    without meta.sha256 -- and the digest is spliced into the same bytes.
+    """
+    payload["meta"]["sha256"] = _SHA_PLACEHOLDER
+    blob = canonical_bytes(payload)
+    placeholder = _SHA_PLACEHOLDER.encode("ascii")
+    member = b'"sha256":"' + placeholder + b'"'
+    i = blob.index(member)
+    j = i + len(member)
+    if blob[i - 1 : i] == b",":
+        i -= 1
+    elif blob[j : j + 1] == b",":
+        j += 1
+    view = memoryview(blob)
+    h = hashlib.sha256(view[:i])
+    h.update(view[j:])
+    digest = h.hexdigest()
+    payload["meta"]["sha256"] = digest
+    return blob.replace(placeholder, digest.encode("ascii"), 1)
+
+
+def write_json(path, payload, compact=False):
     """
     Write JSON with newline-terminated UTF-8 and sha256 in meta.sha256.
     The hash is computed over the payload with any existing meta.sha256
-    field removed.
+    field removed. compact=True writes the canonical (hashed) form itself
+    instead of the indent=2 layout, so the payload is serialized once.
     """
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
@@ -114,23 +178,42 @@ def write_json(path, payload):
         meta = {}
         payload["meta"] = meta
 
-    # Compute hash on a copy without meta.sha256
-    tmp_obj = json.loads(json.dumps(payload, ensure_ascii=False))
-    if "meta" in tmp_obj and isinstance(tmp_obj["meta"], dict):
-        tmp_obj["meta"].pop("sha256", None)
-    digest = sha256_canonical(tmp_obj)
-    meta["sha256"] = digest
+    # Hash with meta.sha256 removed in place (no deep copy of the nodes);
+    # the previous value is put back if hashing fails.
+    prev = meta.pop("sha256", None)
+    try:
+        if compact:
+            data = canonical_bytes_with_sha(payload)
+        else:
+            meta["sha256"] = sha256_canonical(payload)
+            # One encode + one buffered binary write instead of json.dump's
+            # per-token writes through a text wrapper.
+            data = pretty_bytes(payload)
+    except BaseException:
+        meta.pop("sha256", None)
+        if prev is not None:
+            meta["sha256"] = prev
+        raise
 
     tmp = str(p) + ".tmp"
-    with open(tmp, "w", encoding="utf-8", newline="\n") as f:
-        json.dump(payload, f, indent=2, sort_keys=True, ensure_ascii=False)
-        f.write("\n")
+    with open(tmp, "wb", buffering=1 << 20) as f:
+        f.write(data)
+        f.write(b"\n")
+        # Make the bytes durable before the rename publishes them.
+        f.flush()
+        os.fsync(f.fileno())
     os.replace(tmp, p)
 
 
 def read_json(path):
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        data = f.read()
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            pass  # NaN / >64-bit integers: let the stdlib parser handle them
+    return json.loads(data)
 
 
 def dec(s):
@@ -139,9 +222,14 @@ def dec(s):
     return D(str(s))
 
 
-def str_dec(x, ndigits):
-    q = D(10) ** (-ndigits)
-    return str(x.quantize(q)) if ndigits >= 0 else str(x)
+def quantum(ndigits):
+    """Decimal quantum 10**-ndigits for str_dec, or None (no rounding) if ndigits < 0."""
+    return D(10) ** (-ndigits) if ndigits >= 0 else None
+
+
+def str_dec(x, q):
+    # quantize(q) measured faster than format(x, f".{n}f") for these values
+    return str(x.quantize(q)) if q is not None else str(x)
 
 
 def exact_step(left, right, grid):
@@ -152,26 +240,40 @@ def exact_step(left, right, grid):
 
 def build_nodes(left, right, grid, ndigits):
     h = exact_step(left, right, grid)
-    nodes = [str_dec(left + h * D(i), ndigits) for i in range(grid)]
+    q = quantum(ndigits)
     left_check = left + h * D(grid - 1)
     if left_check != right:
         raise RuntimeError(
             f"grid mismatch: left + h*(n-1) != right (got {left_check} vs {right})"
         )
-    return str_dec(h, ndigits), nodes
-
-
-def capture_meta(dps_val, grid):
+    # Accumulate x += h instead of left + h*i: one Decimal add per node.
+    # When h is inexact the sum drifts by a few units in the last of the
+    # getcontext().prec digits, well below the ndigits that are stored.
+    nodes = []
+    append = nodes.append
+    x = left
+    for _ in range(grid - 1):
+        append(str_dec(x, q))
+        x += h
+    append(str_dec(right, q))
+    return str_dec(h, q), nodes
+
+
+@lru_cache(maxsize=1)
+def _platform_meta():
+    # Constant for the process; platform.platform() shells out to uname etc.
     return {
         "python": platform.python_version(),
         "os": platform.platform(),
         "cpu": platform.processor(),
-        "workers_detected": multiprocessing.cpu_count(),
-        "dps": dps_val,
-        "grid": grid,
+        "workers_detected": os.cpu_count() or 1,
     }
 
 
+def capture_meta(dps_val, grid):
+    return {**_platform_meta(), "dps": dps_val, "grid": grid}
+
+
 def main():
     ap = argparse.ArgumentParser(
         description="Create exact bands and grids from window.json (proof-grade IO)."
@@ -237,6 +339,11 @@ def main():
         default=None,
         help="Optional outer band right.",
     )
+    ap.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write the canonical compact JSON (the hashed form) instead of indent=2.",
+    )
 
     args = ap.parse_args()
 
@@ -279,11 +386,14 @@ def main():
 
     grids = {}
     flat_bands = []
+    q = quantum(dps_val)
     for label, L, R in named_specs:
         h_str, nodes = build_nodes(L, R, grid, dps_val)
+        L_str = str_dec(L, q)
+        R_str = str_dec(R, q)
         grids[label] = {
-            "left": str_dec(L, dps_val),
-            "right": str_dec(R, dps_val),
+            "left": L_str,
+            "right": R_str,
             "grid": grid,
             "h": h_str,
             "nodes": nodes,
@@ -291,8 +401,8 @@ def main():
         flat_bands.append(
             {
                 "label": label,
-                "left": str_dec(L, dps_val),
-                "right": str_dec(R, dps_val),
+                "left": L_str,
+                "right": R_str,
             }
         )
 
@@ -324,7 +434,7 @@ def main():
         "meta": meta,
     }
 
-    write_json(args.out, payload)
+    write_json(args.out, payload, compact=args.compact)
     dt = time.time() - t0
     print(
         f"[OK] wrote {args.out} sha256={payload['meta']['sha256'][:16]}... in {dt:.2f}s"
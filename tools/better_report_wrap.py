@@ -13,27 +13,108 @@ import os
 import json
 import time
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any, Optional, Tuple, List, Dict
 from mpmath import mp
 
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
+
 # ---------------- helpers ----------------
 
 def utc_iso() -> str:
     return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
-def load_json(path: str) -> Any:
-    with open(path, "r", encoding="utf-8-sig") as f:
-        return json.load(f)
+# JSON files the readers may load (relative to --inputs-dir / --certs-dir).
+INPUT_JSON_NAMES = ("window.json", "auto_bands.json")
+CERT_JSON_NAMES = (
+    "band_cert.json",
+    "tails.json",
+    "gamma_tail.json",
+    "prime_tail_envelope.json",
+    "prime_block_norm.json",
+    "grid_error_bound.json",
+    "weil_psd_bochner.json",
+    "continuum_operator_cert.json",
+    "continuum_operator_rollup.json",
+    "q_lipschitz.json",
+    "density_metrics.json",
+    "weil_explicit_cert.json",
+    "explicit_formula.json",
+    "core_integral.json",
+    "uniform_certificate.json",
+    "fourier_inversion_cert.json",
+    "deconv_cert_infinite.json",
+    "rv_mangoldt_bounds.json",
+    "frame_probe.json",
+    "subspace_psd_cert.json",
+    "stp_test.json",
+    "cone_uniform_cert.json",
+    "rolling_T_uniform_cert.json",
+    "rolling_T_uniform.json",
+)
+
+# path -> ((st_mtime_ns, st_size), parsed); filled by load_json / prefetch_json.
+_json_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+def _read_json_file(path: str) -> Any:
+    with open(path, "rb") as f:
+        data = f.read()
+    if data.startswith(b"\xef\xbb\xbf"):  # tolerate a UTF-8 BOM, as utf-8-sig did
+        data = data[3:]
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            pass  # NaN / >64-bit integers: let the stdlib parser handle them
+    return json.loads(data.decode("utf-8"))
+
+def _stat_key(path: str) -> Tuple[int, int]:
+    st = stat_path(path)
+    return st.st_mtime_ns, st.st_size
 
-def dig(obj: Any, path: list) -> Optional[Any]:
+def load_json(path: str) -> Any:
+    """Parse `path`, memoized per run while its (mtime, size) is unchanged."""
+    key = _stat_key(path)
+    hit = _json_cache.get(path)
+    if hit is not None and hit[0] == key:
+        return hit[1]
+    obj = _read_json_file(path)
+    _json_cache[path] = (key, obj)
+    return obj
+
+def prefetch_json(paths: List[str], max_workers: int = 8) -> None:
+    """
+    Parse the existing files among `paths` concurrently into the load_json
+    cache, so the readers below do not stall on one read after another.
+    A file that fails to parse is not cached; its reader re-raises as before.
+    """
+    paths = [p for p in paths if exists(p)]
+
+    def job(p: str):
+        try:
+            key = _stat_key(p)
+            return p, key, _read_json_file(p)
+        except Exception:
+            return p, None, None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        for p, key, obj in ex.map(job, paths):
+            if key is not None:
+                _json_cache[p] = (key, obj)
+
+def dig(obj: Any, path: tuple, _get=dict.get) -> Optional[Any]:
     o = obj
     for k in path:
-        if not isinstance(o, dict) or k not in o:
+        if o.__class__ is not dict:
             return None
-        o = o[k]
+        o = _get(o, k)
     return o
 
-def coalesce(obj: Any, paths: list, default: str = "") -> str:
+def coalesce(obj: Any, paths: tuple, default: str = "") -> str:
     for p in paths:
         v = dig(obj, p)
         if v not in (None, "", "null"):
@@ -41,29 +122,134 @@ def coalesce(obj: Any, paths: list, default: str = "") -> str:
     return default
 
 def sha256_file(path: str) -> str:
-    h = hashlib.sha256()
     with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+: read+hash loop in C
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
         for chunk in iter(lambda: f.read(1 << 20), b""):
             h.update(chunk)
-    return h.hexdigest()
+        return h.hexdigest()
 
-def file_meta(path: str) -> Optional[dict]:
-    if not os.path.exists(path):
+@lru_cache(maxsize=256)
+def _cached_sha256(path: str, mtime_ns: int, size: int) -> str:
+    # keyed on (path, mtime, size) so an unchanged file is hashed once per run
+    return sha256_file(path)
+
+def sha256_file_cached(path: str, st: Optional[os.stat_result] = None) -> str:
+    st = st or stat_path(path)
+    return _cached_sha256(path, st.st_mtime_ns, st.st_size)
+
+def file_meta(path: str, hash_files: bool = True) -> Optional[dict]:
+    if not exists(path):
         return None
-    st = os.stat(path)
-    return {
+    st = stat_path(path)
+    meta = {
         "path": path,
         "bytes": int(st.st_size),
         "mtime_utc": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(st.st_mtime)),
-        "sha256": sha256_file(path),
     }
+    if hash_files:
+        meta["sha256"] = sha256_file_cached(path, st)
+    return meta
 
 def mpf_str(x: Any, dps: int) -> str:
     mp.dps = int(dps)
     return mp.nstr(mp.mpf(str(x)), n=mp.dps, strip_zeros=False)
 
+# normalized directory -> {name: DirEntry}; one os.scandir per directory
+# replaces the exists()/stat() round-trips of the readers and meta.files.
+_dir_entries: Dict[str, Dict[str, "os.DirEntry"]] = {}
+
+def scan_dirs(*dirs: str) -> None:
+    for d in dirs:
+        try:
+            with os.scandir(d) as it:
+                _dir_entries[os.path.normpath(d)] = {e.name: e for e in it}
+        except OSError:
+            pass  # missing/unreadable: fall back to per-path checks
+
+def _dir_entry(path: str) -> Tuple[bool, Optional["os.DirEntry"]]:
+    d, name = os.path.split(path)
+    entries = _dir_entries.get(os.path.normpath(d))
+    if entries is None:
+        return False, None
+    return True, entries.get(name)
+
 def exists(path: str) -> bool:
-    return os.path.exists(path)
+    scanned, e = _dir_entry(path)
+    if not scanned:
+        return os.path.exists(path)
+    if e is None:
+        return False
+    return not e.is_symlink() or os.path.exists(path)
+
+def stat_path(path: str) -> os.stat_result:
+    scanned, e = _dir_entry(path)
+    return e.stat() if e is not None else os.stat(path)
+
+# ---------------- lookup paths ----------------
+# Schema-tolerant key paths for coalesce, in order of preference.
+
+WINDOW_MODE_PATHS = (("mode",), ("window", "mode"))
+WINDOW_SIGMA_PATHS = (("sigma",), ("window", "sigma"))
+WINDOW_K0_PATHS = (("k0",), ("window", "k0"), ("notch_k0",), ("window", "notch_k0"))
+CRITICAL_LEFT_PATHS = (("band", "critical_left"), ("critical_left",))
+CRITICAL_RIGHT_PATHS = (("band", "critical_right"), ("critical_right",))
+BAND_MARGIN_LO_PATHS = (
+    ("band_cert", "band_margin_lo"),
+    ("band_margin_lo",),
+    ("numbers", "band_margin_lo"),
+)
+BAND_MARGIN_HI_PATHS = (
+    ("band_cert", "band_margin_hi"),
+    ("band_margin_hi",),
+    ("numbers", "band_margin_hi"),
+)
+GAMMA_TAIL_ENV_PATHS = (
+    ("gamma_tail", "env_T0_hi"),
+    ("env_T0_hi",),
+    ("numbers", "gamma_env_T0_hi"),
+)
+PRIME_TAIL_ENV_PATHS = (
+    ("prime_tail", "env_T0_hi"),
+    ("env_T0_hi",),
+    ("numbers", "prime_env_T0_hi"),
+)
+TAILS_GAMMA_ENV_PATHS = (("gamma", "env_T0_hi"), ("gamma_tail", "env_T0_hi"))
+TAILS_PRIME_ENV_PATHS = (("prime", "env_T0_hi"), ("prime_tail", "env_T0_hi"))
+CAP_HI_PATHS = (("prime_block", "cap_hi"), ("cap_hi",), ("numbers", "cap_hi"))
+GRID_BOUND_HI_PATHS = (
+    ("grid_error", "bound_hi"),
+    ("bound_hi",),
+    ("numbers", "grid_bound_hi"),
+)
+PSD_MIN_SAMPLE_PATHS = (
+    ("weil_psd_bochner", "eval", "min_hat_h_sample"),
+    ("eval", "min_hat_h_sample"),
+    ("numbers", "min_hat_h_sample"),
+)
+PSD_REASON_PATHS = (("weil_psd_bochner", "reason"), ("reason",))
+CONTINUUM_LHS_PATHS = (("continuum", "lhs"), ("lhs",), ("numbers", "lhs"))
+CONTINUUM_EPS_EFF_PATHS = (
+    ("continuum", "eps_eff"),
+    ("eps_eff",),
+    ("numbers", "eps_eff"),
+)
+LIPSCHITZ_L_LO_PATHS = (("q_lipschitz", "L", "lo"), ("L", "lo"))
+LIPSCHITZ_L_HI_PATHS = (("q_lipschitz", "L", "hi"), ("L", "hi"))
+EXPLICIT_EPS_EFF_LO_PATHS = (
+    ("explicit_formula", "epsilon_eff_lo"),
+    ("epsilon_eff_lo",),
+    ("numbers", "epsilon_eff_lo"),
+)
+CORE_LHS_PATHS = (("core_integral", "lhs"), ("lhs",), ("numbers", "lhs"))
+UNIFORM_EPS_EFF_PATHS = (
+    ("uniform_certificate", "epsilon_eff"),
+    ("epsilon_eff",),
+    ("numbers", "epsilon_eff"),
+)
+SUBSPACE_MIN_DIAG_PATHS = (("result", "min_diag_L"), ("min_diag_L",))
+CONE_OK_PATHS = (("ok",), ("numbers", "ok"))
 
 # ---------------- readers (multi-shape) ----------------
 
@@ -73,12 +259,12 @@ def read_window(inputs_dir: str) -> Tuple[dict, dict]:
     wj = load_json(win) if exists(win) else {}
     aj = load_json(auto) if exists(auto) else {}
 
-    mode = coalesce(wj, [["mode"], ["window", "mode"]], "gauss")
-    sigma = coalesce(wj, [["sigma"], ["window", "sigma"]], "6.0")
-    k0    = coalesce(wj, [["k0"], ["window", "k0"], ["notch_k0"], ["window", "notch_k0"]], "0.25")
-    gridN = (dig(aj, ["grid", "N"]) or dig(aj, ["N"]) or 6000)
-    cleft = coalesce(aj, [["band", "critical_left"], ["critical_left"]], "0.30")
-    crght = coalesce(aj, [["band", "critical_right"], ["critical_right"]], "2.80")
+    mode = coalesce(wj, WINDOW_MODE_PATHS, "gauss")
+    sigma = coalesce(wj, WINDOW_SIGMA_PATHS, "6.0")
+    k0    = coalesce(wj, WINDOW_K0_PATHS, "0.25")
+    gridN = (dig(aj, ("grid", "N")) or dig(aj, ("N",)) or 6000)
+    cleft = coalesce(aj, CRITICAL_LEFT_PATHS, "0.30")
+    crght = coalesce(aj, CRITICAL_RIGHT_PATHS, "2.80")
 
     window_summary = {
         "mode": mode,
@@ -97,24 +283,8 @@ def read_band_cert(certs: str) -> dict:
     if not exists(p):
         return {}
     j = load_json(p)
-    band_margin_lo = coalesce(
-        j,
-        [
-            ["band_cert", "band_margin_lo"],
-            ["band_margin_lo"],
-            ["numbers", "band_margin_lo"],
-        ],
-        "",
-    )
-    band_margin_hi = coalesce(
-        j,
-        [
-            ["band_cert", "band_margin_hi"],
-            ["band_margin_hi"],
-            ["numbers", "band_margin_hi"],
-        ],
-        "",
-    )
+    band_margin_lo = coalesce(j, BAND_MARGIN_LO_PATHS, "")
+    band_margin_hi = coalesce(j, BAND_MARGIN_HI_PATHS, "")
     return {
         "band_margin_lo": band_margin_lo,
         "band_margin_hi": band_margin_hi,
@@ -130,30 +300,14 @@ def read_tails_bundle(certs: str) -> dict:
         gj = load_json(gamma_p) if exists(gamma_p) else {}
         pj = load_json(prime_p) if exists(prime_p) else {}
         return {
-            "gamma_env_at_T0": coalesce(
-                gj,
-                [["gamma_tail", "env_T0_hi"], ["env_T0_hi"], ["numbers", "gamma_env_T0_hi"]],
-                "",
-            ),
-            "prime_env_T0_hi": coalesce(
-                pj,
-                [["prime_tail", "env_T0_hi"], ["env_T0_hi"], ["numbers", "prime_env_T0_hi"]],
-                "",
-            ),
+            "gamma_env_at_T0": coalesce(gj, GAMMA_TAIL_ENV_PATHS, ""),
+            "prime_env_T0_hi": coalesce(pj, PRIME_TAIL_ENV_PATHS, ""),
         }
 
     j = load_json(p)
     return {
-        "gamma_env_at_T0": coalesce(
-            j,
-            [["gamma", "env_T0_hi"], ["gamma_tail", "env_T0_hi"]],
-            "",
-        ),
-        "prime_env_T0_hi": coalesce(
-            j,
-            [["prime", "env_T0_hi"], ["prime_tail", "env_T0_hi"]],
-            "",
-        ),
+        "gamma_env_at_T0": coalesce(j, TAILS_GAMMA_ENV_PATHS, ""),
+        "prime_env_T0_hi": coalesce(j, TAILS_PRIME_ENV_PATHS, ""),
     }
 
 def read_prime_block_and_grid(certs: str) -> dict:
@@ -161,24 +315,8 @@ def read_prime_block_and_grid(certs: str) -> dict:
     grid_p  = os.path.join(certs, "grid_error_bound.json")
     pj = load_json(prime_p) if exists(prime_p) else {}
     gj = load_json(grid_p) if exists(grid_p) else {}
-    cap_hi = coalesce(
-        pj,
-        [
-            ["prime_block", "cap_hi"],
-            ["cap_hi"],
-            ["numbers", "cap_hi"],
-        ],
-        "",
-    )
-    grid_hi = coalesce(
-        gj,
-        [
-            ["grid_error", "bound_hi"],
-            ["bound_hi"],
-            ["numbers", "grid_bound_hi"],
-        ],
-        "",
-    )
+    cap_hi = coalesce(pj, CAP_HI_PATHS, "")
+    grid_hi = coalesce(gj, GRID_BOUND_HI_PATHS, "")
     return {
         "cap_hi": cap_hi,
         "grid_bound_hi": grid_hi,
@@ -190,23 +328,8 @@ def read_weil_psd(certs: str) -> dict:
         return {}
     j = load_json(p)
     status = "PASS" if j.get("PASS", True) else "FAIL"
-    min_sample = coalesce(
-        j,
-        [
-            ["weil_psd_bochner", "eval", "min_hat_h_sample"],
-            ["eval", "min_hat_h_sample"],
-            ["numbers", "min_hat_h_sample"],
-        ],
-        "",
-    )
-    reason = coalesce(
-        j,
-        [
-            ["weil_psd_bochner", "reason"],
-            ["reason"],
-        ],
-        "",
-    )
+    min_sample = coalesce(j, PSD_MIN_SAMPLE_PATHS, "")
+    reason = coalesce(j, PSD_REASON_PATHS, "")
     return {
         "status": status,
         "min_hat_h_sample": min_sample,
@@ -224,24 +347,8 @@ def read_continuum(certs: str) -> dict:
         p = p_alt
 
     j = load_json(p)
-    lhs = coalesce(
-        j,
-        [
-            ["continuum", "lhs"],
-            ["lhs"],
-            ["numbers", "lhs"],
-        ],
-        "",
-    )
-    eps_eff = coalesce(
-        j,
-        [
-            ["continuum", "eps_eff"],
-            ["eps_eff"],
-            ["numbers", "eps_eff"],
-        ],
-        "",
-    )
+    lhs = coalesce(j, CONTINUUM_LHS_PATHS, "")
+    eps_eff = coalesce(j, CONTINUUM_EPS_EFF_PATHS, "")
     status = "PASS" if j.get("PASS", True) else "FAIL"
     return {
         "lhs": lhs,
@@ -254,8 +361,8 @@ def read_lipschitz(certs: str) -> dict:
     if not exists(p):
         return {}
     j = load_json(p)
-    L_lo = coalesce(j, [["q_lipschitz", "L", "lo"], ["L", "lo"]], "")
-    L_hi = coalesce(j, [["q_lipschitz", "L", "hi"], ["L", "hi"]], "")
+    L_lo = coalesce(j, LIPSCHITZ_L_LO_PATHS, "")
+    L_hi = coalesce(j, LIPSCHITZ_L_HI_PATHS, "")
     return {
         "L_lo": L_lo,
         "L_hi": L_hi,
@@ -279,15 +386,7 @@ def read_explicit(certs: str) -> dict:
             return {}
         p = p_alt
     j = load_json(p)
-    eps_eff_lo = coalesce(
-        j,
-        [
-            ["explicit_formula", "epsilon_eff_lo"],
-            ["epsilon_eff_lo"],
-            ["numbers", "epsilon_eff_lo"],
-        ],
-        "",
-    )
+    eps_eff_lo = coalesce(j, EXPLICIT_EPS_EFF_LO_PATHS, "")
     return {
         "epsilon_eff_lo": eps_eff_lo,
         "PASS": bool(j.get("PASS", True)),
@@ -298,11 +397,7 @@ def read_core_integral(certs: str) -> dict:
     if not exists(p):
         return {}
     j = load_json(p)
-    lhs = coalesce(
-        j,
-        [["core_integral", "lhs"], ["lhs"], ["numbers", "lhs"]],
-        "",
-    )
+    lhs = coalesce(j, CORE_LHS_PATHS, "")
     status = "PASS" if j.get("PASS", True) else "FAIL"
     return {
         "lhs": lhs,
@@ -314,15 +409,7 @@ def read_uniform(certs: str) -> dict:
     if not exists(p):
         return {}
     j = load_json(p)
-    eps_eff = coalesce(
-        j,
-        [
-            ["uniform_certificate", "epsilon_eff"],
-            ["epsilon_eff"],
-            ["numbers", "epsilon_eff"],
-        ],
-        "",
-    )
+    eps_eff = coalesce(j, UNIFORM_EPS_EFF_PATHS, "")
     return {
         "epsilon_eff": eps_eff,
         "PASS": bool(j.get("PASS", True)),
@@ -370,14 +457,7 @@ def read_subspace_psd(certs: str) -> dict:
         return {}
     j = load_json(p)
     status = "PASS" if j.get("PASS", True) else "FAIL"
-    min_diag = coalesce(
-        j,
-        [
-            ["result", "min_diag_L"],
-            ["min_diag_L"],
-        ],
-        "",
-    )
+    min_diag = coalesce(j, SUBSPACE_MIN_DIAG_PATHS, "")
     return {
         "status": status,
         "min_diag_L": min_diag,
@@ -399,9 +479,9 @@ def read_cone_uniform(certs: str) -> dict:
     if not exists(p):
         return {"status": "N/A", "ok": "", "sha256": ""}
     j = load_json(p)
-    ok = coalesce(j, [["ok"], ["numbers", "ok"]], "")
+    ok = coalesce(j, CONE_OK_PATHS, "")
     status = "PASS" if (j.get("PASS", True)) else "FAIL"
-    return {"status": status, "ok": ok, "sha256": sha256_file(p)}
+    return {"status": status, "ok": ok, "sha256": sha256_file_cached(p)}
 
 def read_rolling_T(certs: str) -> dict:
     p = os.path.join(certs, "rolling_T_uniform_cert.json")
@@ -413,11 +493,12 @@ def read_rolling_T(certs: str) -> dict:
         p = p2
     j = load_json(p)
     status = "PASS" if j.get("PASS", True) else "FAIL"
-    return {"status": status, "numbers": j.get("numbers", {}), "sha256": sha256_file(p)}
+    return {"status": status, "numbers": j.get("numbers", {}), "sha256": sha256_file_cached(p)}
 
 # ---------------- main ----------------
 
-def collect_meta_files(certs_dir: str, inputs_dir: str) -> List[Dict[str, Any]]:
+def collect_meta_files(certs_dir: str, inputs_dir: str, max_workers: int = 8,
+                       hash_files: bool = False) -> List[Dict[str, Any]]:
     paths = []
 
     # inputs
@@ -462,12 +543,15 @@ def collect_meta_files(certs_dir: str, inputs_dir: str) -> List[Dict[str, Any]]:
     ]:
         paths.append(os.path.join(certs_dir, name))
 
-    meta_files: List[Dict[str, Any]] = []
-    for p in paths:
-        m = file_meta(p)
-        if m is not None:
-            meta_files.append(m)
-    return meta_files
+    # Without hashing this is only a stat per path. Files hash independently;
+    # hashlib releases the GIL on large buffers, so threads run the digests in
+    # parallel. Order follows `paths`.
+    if hash_files and max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            metas = list(ex.map(lambda p: file_meta(p, True), paths))
+    else:
+        metas = [file_meta(p, hash_files) for p in paths]
+    return [m for m in metas if m is not None]
 
 def main() -> None:
     ap = argparse.ArgumentParser()
@@ -476,8 +560,18 @@ def main() -> None:
     ap.add_argument("--out-md", required=True, help="Output Markdown summary path")
     ap.add_argument("--out-json", required=True, help="Output JSON wrap path")
     ap.add_argument("--dps", type=int, default=220)
+    ap.add_argument("--io-threads", type=int, default=8, help="Threads for reading certificate JSON up front and hashing meta.files (<= 1: serial)")
+    ap.add_argument("--hash-files", action="store_true", help="Include sha256 for every file listed in meta.files (off: size + mtime only)")
     args = ap.parse_args()
 
+    scan_dirs(args.inputs_dir, args.certs_dir)
+    if args.io_threads > 1:
+        prefetch_json(
+            [os.path.join(args.inputs_dir, n) for n in INPUT_JSON_NAMES]
+            + [os.path.join(args.certs_dir, n) for n in CERT_JSON_NAMES],
+            max_workers=args.io_threads,
+        )
+
     # Core sections
     window, bands = read_window(args.inputs_dir)
     band_cert     = read_band_cert(args.certs_dir)
@@ -502,14 +596,8 @@ def main() -> None:
     rollT         = read_rolling_T(args.certs_dir)
 
     # Verdict (very conservative: PASS if no explicit FAILs in core/explicit/uniform/cont/psd)
-    fails: List[str] = []
-
-    def flag_fail(name: str, section: Any) -> None:
-        if isinstance(section, dict) and section.get("status") == "FAIL":
-            fails.append(name)
-
-    # mark critical sections
-    for nm, sec in [
+    # critical sections; every reader returns a dict
+    critical = (
         ("continuum_operator", cont),
         ("uniform_certificate", uniform),
         ("weil_psd_bochner", psd),
@@ -518,8 +606,8 @@ def main() -> None:
         ("subspace_psd", subpsd),
         ("deconv", deconv),
         ("rv_mangoldt", rvm),
-    ]:
-        flag_fail(nm, sec)
+    )
+    fails: List[str] = [nm for nm, sec in critical if sec.get("status") == "FAIL"]
 
     verdict = "PASS" if not fails else "FAIL"
 
@@ -558,7 +646,7 @@ def main() -> None:
             "tool": "better_report_wrap",
             "dps": int(args.dps),
             "created_utc": utc_iso(),
-            "files": collect_meta_files(args.certs_dir, args.inputs_dir),
+            "files": collect_meta_files(args.certs_dir, args.inputs_dir, args.io_threads, args.hash_files),
         },
     }
 
@@ -583,8 +671,10 @@ def main() -> None:
     with open(args.out_md, "w", encoding="utf-8") as f_md:
         f_md.write("\n".join(md_lines))
 
-    with open(args.out_json, "w", encoding="utf-8") as f_js:
-        json.dump(wrap, f_js, indent=2, sort_keys=False)
+    # Serialize once; the same bytes are what a wrap-level digest would hash.
+    data = json.dumps(wrap, indent=2, sort_keys=False).encode("utf-8")
+    with open(args.out_json, "wb") as f_js:
+        f_js.write(data)
 
 if __name__ == "__main__":
     main()
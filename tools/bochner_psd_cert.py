@@ -19,7 +19,8 @@ CLI (v2.1 normalized):
   --out            : output JSON path (e.g. PROOF_PACKET/weil_psd_bochner.json)
   --dps            : decimal precision for mpmath (default 200)
   --sweep-T        : half-width of numeric sweep in t (default 200.0)
-  --sweep-steps    : number of sweep sample points (default 40001)
+  --sweep-steps    : number of sweep sample points (default 40001;
+                     0 skips the sweep and writes null eval values)
 
 JSON (v2.1 normalized):
   kind = "weil_psd_bochner"
@@ -42,8 +43,8 @@ JSON (v2.1 normalized):
       notch_k0          # notch location k0 (stringified mp.mpf)
     }
     eval {
-      min_hat_h_sample, # numeric min of h_hat(t) on sweep
-      t_at_min,         # t where min was observed
+      min_hat_h_sample, # numeric min of h_hat(t) on sweep (null if skipped)
+      t_at_min,         # t where min was observed (null if skipped)
       sweep_T,
       sweep_steps
     }
@@ -65,18 +66,60 @@ Notes:
 
 import os
 import json
+import hashlib
 import argparse
+from functools import lru_cache
 from mpmath import mp
 from datetime import datetime, timezone
 
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
+
 
 # ---------------------------------------------------------------------------
 # Utility helpers
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=None)
+def source_date_epoch():
+    """
+    SOURCE_DATE_EPOCH as an int, or None if unset. main() calls this first, so
+    a malformed value fails with a message before any work is done.
+    """
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if not epoch:
+        return None
+    try:
+        value = int(epoch)
+        datetime.fromtimestamp(value, tz=timezone.utc)
+    except (ValueError, OverflowError, OSError):
+        raise SystemExit(
+            f"[bochner_psd_cert] SOURCE_DATE_EPOCH must be an integer Unix timestamp, "
+            f"got {epoch!r}"
+        )
+    return value
+
+
+_NOW_UTC_ISO = None
+
+
 def now_utc_iso() -> str:
-    """Return current UTC time as an ISO-8601 string with trailing 'Z'."""
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    """
+    Return current UTC time as an ISO-8601 string with trailing 'Z'.
+    If SOURCE_DATE_EPOCH is set, that time is used instead, so identical
+    inputs give identical bytes (and sha256). Computed once per process.
+    """
+    global _NOW_UTC_ISO
+    if _NOW_UTC_ISO is None:
+        epoch = source_date_epoch()
+        if epoch is not None:
+            now = datetime.fromtimestamp(epoch, tz=timezone.utc)
+        else:
+            now = datetime.now(timezone.utc)
+        _NOW_UTC_ISO = now.isoformat().replace("+00:00", "Z")
+    return _NOW_UTC_ISO
 
 
 def set_precision(dps: int) -> None:
@@ -86,59 +129,121 @@ def set_precision(dps: int) -> None:
 
 def load_json(path: str):
     """Load JSON from disk."""
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return loads_json(f.read())
+
+
+def loads_json(data: bytes):
+    # orjson rejects a few inputs the stdlib accepts (NaN, >64-bit integers);
+    # defer to json for those so behaviour matches the stdlib reader.
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def dumps_json(obj) -> bytes:
+    """indent=2 UTF-8 JSON; orjson when importable, else the stdlib."""
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # e.g. >64-bit integers
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
 
 
 def coalesce(d, *keys, default=None):
     """
     Search (possibly nested) dict d for the first present key path.
     Each key can be a string 'a' or a tuple path like ('window','sigma').
+    A missing key or a non-dict along the path raises KeyError/TypeError,
+    which moves on to the next path.
     """
     for k in keys:
-        if isinstance(k, tuple):
-            cur = d
-            ok = True
-            for part in k:
-                if isinstance(cur, dict) and part in cur:
+        cur = d
+        try:
+            if type(k) is tuple:
+                for part in k:
                     cur = cur[part]
-                else:
-                    ok = False
-                    break
-            if ok:
-                return cur
-        else:
-            if isinstance(d, dict) and k in d:
-                return d[k]
+            else:
+                cur = cur[k]
+        except (KeyError, TypeError, IndexError):
+            continue
+        return cur
     return default
 
 
-def _sha256_bytes(b: bytes) -> str:
-    """Compute SHA-256 hex digest of a bytes object."""
-    import hashlib
-    h = hashlib.sha256()
-    h.update(b)
-    return h.hexdigest()
+def write_if_changed(path, data: bytes) -> bool:
+    """
+    Write data to path unless the file already holds exactly these bytes
+    (size compared first). Leaving an identical file untouched keeps its
+    mtime, so make-style pipelines do not rerun downstream steps. Returns
+    True if the file was written.
+    """
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, "rb") as f:
+                if f.read() == data:
+                    return False
+    except OSError:
+        pass
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
+
+
+_SHA_PLACEHOLDER = "<SHA256_PLACEHOLDER>"
 
 
 def _write_json(path: str, obj: dict) -> str:
     """
-    Write JSON to path (UTF-8, pretty-printed) and return SHA-256 digest
-    of the on-disk bytes.
+    Write JSON to path (UTF-8, pretty-printed) with obj["meta"]["sha256"] set
+    to the SHA-256 of the same bytes with meta.sha256 == "". Serializes once
+    with a placeholder, hashes around it and writes the digest in its place.
+    Returns the digest.
     """
     d = os.path.dirname(path)
     if d:
         os.makedirs(d, exist_ok=True)
-    s = json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
-    with open(path, "wb") as f:
-        f.write(s)
-    return _sha256_bytes(s)
+    obj["meta"]["sha256"] = _SHA_PLACEHOLDER
+    s = dumps_json(obj)
+    placeholder = _SHA_PLACEHOLDER.encode("ascii")
+    i = s.index(placeholder)
+    j = i + len(placeholder)
+    view = memoryview(s)
+    h = hashlib.sha256(view[:i])
+    h.update(view[j:])
+    sha = h.hexdigest()
+    obj["meta"]["sha256"] = sha
+    write_if_changed(path, b"".join((view[:i], sha.encode("ascii"), view[j:])))
+    return sha
 
 
 # ---------------------------------------------------------------------------
 # Window parsing and PSD logic
 # ---------------------------------------------------------------------------
 
+# Key paths tried, in order, by parse_window.
+_MODE_KEYS = ("mode", ("window", "mode"), ("window", "type"))
+_SIGMA_KEYS = (
+    "sigma",
+    "gauss_sigma",
+    ("window", "sigma"),
+    ("window", "gauss_sigma"),
+    ("window", "params", "sigma"),
+)
+_K0_KEYS = (
+    "notch_k0",
+    "k0",
+    ("window", "notch_k0"),
+    ("window", "params", "notch_k0"),
+    ("notch", "k0"),
+    ("window", "notch", "k0"),
+)
+
+
 def parse_window(path: str):
     """
     Parse Gaussian-notch window JSON from multiple possible schemas, e.g.:
@@ -148,36 +253,21 @@ def parse_window(path: str):
       { "mode":"gauss","gauss_sigma":5.6,"notch":{"k0":0.25} }
       { "window":{"mode":"gauss","params":{"sigma":5.6,"notch_k0":0.25}} }
 
-    Returns (mode, sigma, k0, raw_json).
+    Returns (mode, sigma, k0, raw_json). Results are memoized on the file's
+    (path, mtime, size) and the current mp.prec; raw_json is shared between
+    calls and must not be mutated.
     """
-    js = load_json(path)
+    st = os.stat(path)
+    return _parse_window_cached(path, st.st_mtime_ns, st.st_size, mp.prec)
 
-    mode = coalesce(
-        js,
-        "mode",
-        ("window", "mode"),
-        ("window", "type"),
-        default="gauss",
-    )
 
-    sigma = coalesce(
-        js,
-        "sigma",
-        "gauss_sigma",
-        ("window", "sigma"),
-        ("window", "gauss_sigma"),
-        ("window", "params", "sigma"),
-    )
+@lru_cache(maxsize=32)
+def _parse_window_cached(path, mtime_ns, size, prec):
+    js = load_json(path)
 
-    k0 = coalesce(
-        js,
-        "notch_k0",
-        "k0",
-        ("window", "notch_k0"),
-        ("window", "params", "notch_k0"),
-        ("notch", "k0"),
-        ("window", "notch", "k0"),
-    )
+    mode = coalesce(js, *_MODE_KEYS, default="gauss")
+    sigma = coalesce(js, *_SIGMA_KEYS)
+    k0 = coalesce(js, *_K0_KEYS)
 
     if sigma is None:
         raise KeyError(
@@ -195,13 +285,22 @@ def parse_window(path: str):
     return mode, sigma, k0, js
 
 
-def hhat(t, sigma, k0):
+def hhat(t, sigma, k0, inv_sigma2=None, inv_k02=None):
     """
     Frequency-domain kernel:
 
       h_hat(t) = exp(-(t/sigma)^2) * (1 - exp(-(t/k0)^2))
+
+    inv_sigma2 = 1/sigma^2 and inv_k02 = 1/k0^2 may be passed in when
+    evaluating in a loop. The notch factor uses expm1, which stays accurate
+    near t = 0.
     """
-    return mp.e ** (-(t / sigma) ** 2) * (1 - mp.e ** (-(t / k0) ** 2))
+    if inv_sigma2 is None:
+        inv_sigma2 = 1 / (sigma * sigma)
+    if inv_k02 is None:
+        inv_k02 = 1 / (k0 * k0)
+    tt = t * t
+    return mp.exp(-tt * inv_sigma2) * (-mp.expm1(-tt * inv_k02))
 
 
 def analytic_psd_holds(sigma, k0) -> bool:
@@ -220,18 +319,29 @@ def numeric_sweep(sigma, k0, T=100.0, steps=20001):
     """
     Numerically sample h_hat(t) on [-T, T] to find a minimum value.
     This is telemetry only and not used in the formal inequality budget.
+
+    h_hat is even, and on t >= 0 it rises from 0 to a single peak and then
+    decays (d/d(t^2) log h_hat is strictly decreasing). On either half of the
+    grid the smallest sample is therefore at its innermost or outermost point,
+    so only the two end samples and the one or two samples nearest t = 0 are
+    evaluated. The result is the same as scanning every sample in order.
     """
     T = mp.mpf(T)
     steps = int(steps)
     if steps < 2:
         steps = 2
 
-    mn = mp.inf
-    argmin = mp.ninf
+    inv_sigma2 = 1 / (sigma * sigma)
+    inv_k02 = 1 / (k0 * k0)
 
-    for i in range(steps):
+    # Seed with the t = -T sample, so no comparison against an inf sentinel.
+    argmin = -T
+    mn = hhat(argmin, sigma, k0, inv_sigma2, inv_k02)
+
+    mid = (steps - 1) // 2
+    for i in sorted({mid, steps - 1 - mid, steps - 1} - {0}):
         t = -T + (2 * T) * mp.mpf(i) / (steps - 1)
-        val = hhat(t, sigma, k0)
+        val = hhat(t, sigma, k0, inv_sigma2, inv_k02)
         if val < mn:
             mn = val
             argmin = t
@@ -243,7 +353,7 @@ def numeric_sweep(sigma, k0, T=100.0, steps=20001):
 # Main CLI entry point
 # ---------------------------------------------------------------------------
 
-def main():
+def main(argv=None):
     ap = argparse.ArgumentParser(
         description="Bochner PSD certificate for Gaussian-notch window"
     )
@@ -263,9 +373,10 @@ def main():
         "--sweep-steps",
         type=int,
         default=40001,
-        help="number of sample points in numeric sweep",
+        help="number of sample points in numeric sweep (0: skip the sweep)",
     )
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
+    source_date_epoch()
 
     set_precision(args.dps)
 
@@ -274,10 +385,13 @@ def main():
     # Analytic Bochner PSD check
     passed = analytic_psd_holds(sigma, k0)
 
-    # Numeric telemetry sweep
-    min_val, t_at_min = numeric_sweep(
-        sigma, k0, T=args.sweep_T, steps=args.sweep_steps
-    )
+    # Numeric telemetry sweep (--sweep-steps 0 skips it)
+    if args.sweep_steps <= 0:
+        min_val, t_at_min = None, None
+    else:
+        min_val, t_at_min = numeric_sweep(
+            sigma, k0, T=args.sweep_T, steps=args.sweep_steps
+        )
 
     payload = {
         "kind": "weil_psd_bochner",
@@ -303,8 +417,8 @@ def main():
                 "notch_k0": mp.nstr(k0, n=mp.dps),
             },
             "eval": {
-                "min_hat_h_sample": mp.nstr(min_val, n=mp.dps),
-                "t_at_min": mp.nstr(t_at_min, n=mp.dps),
+                "min_hat_h_sample": None if min_val is None else mp.nstr(min_val, n=mp.dps),
+                "t_at_min": None if t_at_min is None else mp.nstr(t_at_min, n=mp.dps),
                 "sweep_T": float(args.sweep_T),
                 "sweep_steps": int(args.sweep_steps),
             },
@@ -318,9 +432,6 @@ def main():
         },
     }
 
-    # First write to compute SHA-256, then embed it and rewrite.
-    sha = _write_json(args.out, payload)
-    payload["meta"]["sha256"] = sha
     sha = _write_json(args.out, payload)
 
     status = "PASS=True" if passed else "PASS=False"
@@ -62,35 +62,135 @@ import argparse
 import json
 import os
 import time
+from functools import lru_cache
 from mpmath import mp
 
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
+
 
 # ---------- basic helpers ----------
 
+@lru_cache(maxsize=None)
+def source_date_epoch():
+    """
+    SOURCE_DATE_EPOCH as an int, or None if unset. main() calls this first, so
+    a malformed value fails with a message before any work is done.
+    """
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if not epoch:
+        return None
+    try:
+        value = int(epoch)
+        time.gmtime(value)
+    except (ValueError, OverflowError, OSError):
+        raise SystemExit(
+            f"[continuum_operator_rollup] SOURCE_DATE_EPOCH must be an integer Unix timestamp, "
+            f"got {epoch!r}"
+        )
+    return value
+
+
+_NOW_UTC_ISO = None
+
+
+def now_utc_iso():
+    """
+    UTC time as YYYY-MM-DDTHH:MM:SSZ; SOURCE_DATE_EPOCH, if set, is used
+    instead of the clock so reruns are byte-identical. Computed once.
+    """
+    global _NOW_UTC_ISO
+    if _NOW_UTC_ISO is None:
+        epoch = source_date_epoch()
+        t = time.gmtime(epoch) if epoch is not None else time.gmtime()
+        _NOW_UTC_ISO = time.strftime("%Y-%m-%dT%H:%M:%SZ", t)
+    return _NOW_UTC_ISO
+
+
+def write_if_changed(path, data: bytes) -> bool:
+    """Skip the write (keeping the mtime) when path already has these bytes."""
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, "rb") as f:
+                if f.read() == data:
+                    return False
+    except OSError:
+        pass
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
+
+
 def set_prec(dps):
     mp.dps = int(dps)
 
 
 def mpf(x):
-    return mp.mpf(str(x))
+    # mpf values pass through and JSON strings parse directly; numbers still
+    # go through str() so a JSON 0.1 means decimal 0.1, not the nearest double.
+    if isinstance(x, mp.mpf):
+        return x
+    return mp.mpf(x if type(x) is str else str(x))
 
 
 def mpstr(x):
-    return mp.nstr(mp.mpf(x), n=mp.dps, strip_zeros=False)
+    m = mp.mpf(x)
+    if not m:
+        return "0.0"  # what nstr gives for zero, without the formatting pass
+    return mp.nstr(m, n=mp.dps, strip_zeros=False)
 
 
 def jload(path):
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return loads_json(f.read())
+
+
+def loads_json(data: bytes):
+    # orjson rejects a few inputs the stdlib accepts (NaN, >64-bit integers);
+    # defer to json for those so behaviour matches the stdlib reader.
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def dumps_json(obj) -> bytes:
+    """indent=2 UTF-8 JSON; orjson when importable, else the stdlib."""
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # e.g. >64-bit integers
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+@lru_cache(maxsize=32)
+def _jload_cached(path, mtime_ns, size):
+    return jload(path)
+
+
+def jload_cached(path):
+    """
+    jload memoized on (path, mtime, size), so repeated rollups in one process
+    parse each input once; a rewritten file is reloaded. The returned dict is
+    shared between callers and must not be mutated.
+    """
+    st = os.stat(path)
+    return _jload_cached(path, st.st_mtime_ns, st.st_size)
 
 
 def dig(obj, path):
     """Safe nested lookup; returns None if any key is missing."""
     o = obj
-    for k in path:
-        if not isinstance(o, dict) or k not in o:
-            return None
-        o = o[k]
+    try:
+        for k in path:
+            o = o[k]
+    except (KeyError, TypeError, IndexError):
+        return None
     return o
 
 
@@ -110,6 +210,39 @@ def mpf_from_paths(js, paths, default=None):
 
 # ---------- v2.1-aware extractors ----------
 
+# Key paths tried, in order, by the extractors below.
+BAND_MARGIN_PATHS = (
+    ("band_cert", "band_margin_lo"),
+    ("band_cert", "band_margin", "lo"),
+    ("numbers", "band_margin"),
+    ("band_margin",),
+)
+PRIME_BLOCK_CAP_PATHS = (
+    ("prime_block_norm", "cap_total_hi"),
+    ("prime_block_norm", "used_operator_norm"),
+    ("numbers", "cap_total_hi"),
+    ("used_operator_norm",),
+    ("operator_norm_cap_hi",),
+    ("operator_norm_cap",),
+)
+PRIME_TAIL_NORM_PATHS = (
+    ("prime_tail", "norm"),
+    ("numbers", "prime_tail_norm"),
+    ("prime_tail_norm",),
+)
+GAMMA_ENV_T0_PATHS = (
+    ("gamma_tails", "gamma_env_at_T0"),
+    ("gamma_env_at_T0",),
+    ("gamma_tails", "tails_total"),
+    ("tails_total",),
+)
+GRID_ERROR_PATHS = (
+    ("grid_error_bound", "bound_hi"),
+    ("numbers", "grid_error_norm"),
+    ("grid_error_norm",),
+)
+
+
 def get_band_margin(js):
     """
     band_cert.json (v2.1 expected):
@@ -122,15 +255,7 @@ def get_band_margin(js):
 
     Fallbacks kept for safety.
     """
-    return mpf_from_paths(
-        js,
-        [
-            ("band_cert", "band_margin_lo"),
-            ("band_cert", "band_margin", "lo"),
-            ("numbers", "band_margin"),
-            ("band_margin",),
-        ],
-    )
+    return mpf_from_paths(js, BAND_MARGIN_PATHS)
 
 
 def get_prime_block_cap(js):
@@ -148,17 +273,7 @@ def get_prime_block_cap(js):
 
     Canonical cap is cap_total_hi; fall back to used_operator_norm, etc.
     """
-    return mpf_from_paths(
-        js,
-        [
-            ("prime_block_norm", "cap_total_hi"),
-            ("prime_block_norm", "used_operator_norm"),
-            ("numbers", "cap_total_hi"),
-            ("used_operator_norm",),
-            ("operator_norm_cap_hi",),
-            ("operator_norm_cap",),
-        ],
-    )
+    return mpf_from_paths(js, PRIME_BLOCK_CAP_PATHS)
 
 
 def get_prime_tail_norm(js):
@@ -173,14 +288,7 @@ def get_prime_tail_norm(js):
 
     Canonical scalar is prime_tail.norm.
     """
-    return mpf_from_paths(
-        js,
-        [
-            ("prime_tail", "norm"),
-            ("numbers", "prime_tail_norm"),
-            ("prime_tail_norm",),
-        ],
-    )
+    return mpf_from_paths(js, PRIME_TAIL_NORM_PATHS)
 
 
 def get_gamma_env_T0(js):
@@ -199,16 +307,7 @@ def get_gamma_env_T0(js):
 
     If absent, fall back to tails_total or 0.
     """
-    return mpf_from_paths(
-        js,
-        [
-            ("gamma_tails", "gamma_env_at_T0"),
-            ("gamma_env_at_T0",),
-            ("gamma_tails", "tails_total"),
-            ("tails_total",),
-        ],
-        default="0",
-    )
+    return mpf_from_paths(js, GAMMA_ENV_T0_PATHS, default="0")
 
 
 def get_grid_error(js):
@@ -222,20 +321,12 @@ def get_grid_error(js):
 
     If missing, default to 0 (grid error disabled).
     """
-    return mpf_from_paths(
-        js,
-        [
-            ("grid_error_bound", "bound_hi"),
-            ("numbers", "grid_error_norm"),
-            ("grid_error_norm",),
-        ],
-        default="0",
-    )
+    return mpf_from_paths(js, GRID_ERROR_PATHS, default="0")
 
 
 # ---------- main ----------
 
-def main():
+def main(argv=None):
     ap = argparse.ArgumentParser(
         description="Continuum operator inequality rollup (v2.1 normalized)."
     )
@@ -256,21 +347,22 @@ def main():
     )
     ap.add_argument("--dps", type=int, default=200, help="mpmath precision")
     ap.add_argument("--out", required=True, help="Output JSON path.")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
+    source_date_epoch()
 
     set_prec(args.dps)
 
-    band_js = jload(args.band_cert)
-    pblk_js = jload(args.prime_block)
-    ptail_js = jload(args.prime_tail)
+    band_js = jload_cached(args.band_cert)
+    pblk_js = jload_cached(args.prime_block)
+    ptail_js = jload_cached(args.prime_tail)
 
     gamma_js = {}
     if args.gamma_tails and os.path.exists(args.gamma_tails):
-        gamma_js = jload(args.gamma_tails)
+        gamma_js = jload_cached(args.gamma_tails)
 
     grid_js = {}
     if args.grid_error and os.path.exists(args.grid_error):
-        grid_js = jload(args.grid_error)
+        grid_js = jload_cached(args.grid_error)
 
     band_margin = get_band_margin(band_js)
     prime_block_cap = get_prime_block_cap(pblk_js)
@@ -306,12 +398,11 @@ def main():
         "meta": {
             "tool": "continuum_operator_rollup",
             "dps": str(mp.dps),
-            "created_utc": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "created_utc": now_utc_iso(),
         },
     }
 
-    with open(args.out, "w", encoding="utf-8", newline="\n") as f:
-        json.dump(out, f, indent=2, ensure_ascii=False)
+    write_if_changed(args.out, dumps_json(out))
 
     status = "PASS" if PASS else "FAIL"
     print(
@@ -11,6 +11,8 @@ a normalized JSON block used by downstream rollup tools.
 CLI (v2.1 normalized)
 ---------------------
   --T0             : cutoff height T0 (string, high-precision)
+  --T0-grid        : comma-separated T0 values, evaluated in one run
+                     (alternative to --T0; writes kind = "gamma_tails_grid")
   --window-config  : path to window JSON from window_gen.py
   --dps            : decimal precision for mpmath
   --out            : output JSON path
@@ -34,6 +36,12 @@ JSON (v2.1 normalized)
     created_utc
   }
 
+  With --T0-grid:
+  kind = "gamma_tails_grid"
+  inputs { T0_grid, window_config_path }
+  gamma_tails_grid [ { T0, gamma_env_at_T0, c1, c2, tails_total }, ... ]
+  meta { ... as above }
+
 Comments
 --------
 - gamma_env_at_T0 is the value passed into rollup tools.
@@ -41,21 +49,102 @@ Comments
 
 import argparse
 import json
+import os
 import time
+from functools import lru_cache
 from mpmath import mp
 
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
+
+
+def loads_json(data: bytes):
+    # orjson rejects a few inputs the stdlib accepts (NaN, >64-bit integers);
+    # defer to json for those so behaviour matches the stdlib reader.
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def dumps_json(obj) -> bytes:
+    """indent=2 UTF-8 JSON; orjson when importable, else the stdlib."""
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # e.g. >64-bit integers
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def source_date_epoch():
+    """
+    SOURCE_DATE_EPOCH as an int, or None if unset. main() calls this first, so
+    a malformed value fails with a message before any work is done.
+    """
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if not epoch:
+        return None
+    try:
+        value = int(epoch)
+        time.gmtime(value)
+    except (ValueError, OverflowError, OSError):
+        raise SystemExit(
+            f"[core_interval_prover] SOURCE_DATE_EPOCH must be an integer Unix timestamp, "
+            f"got {epoch!r}"
+        )
+    return value
+
+
+_NOW_UTC_ISO = None
+
+
+def now_utc_iso():
+    """
+    UTC time as YYYY-MM-DDTHH:MM:SSZ; SOURCE_DATE_EPOCH, if set, is used
+    instead of the clock so reruns are byte-identical. Computed once.
+    """
+    global _NOW_UTC_ISO
+    if _NOW_UTC_ISO is None:
+        epoch = source_date_epoch()
+        t = time.gmtime(epoch) if epoch is not None else time.gmtime()
+        _NOW_UTC_ISO = time.strftime("%Y-%m-%dT%H:%M:%SZ", t)
+    return _NOW_UTC_ISO
+
+
+def write_if_changed(path, data: bytes) -> bool:
+    """Write data to path only if its current bytes differ; True if written."""
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, "rb") as f:
+                if f.read() == data:
+                    return False
+    except OSError:
+        pass
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
+
 
 def set_prec(dps):
     mp.dps = int(dps)
 
 
 def mpstr(x):
-    return mp.nstr(mp.mpf(x), n=mp.dps, strip_zeros=False)
+    m = mp.mpf(x)
+    if not m:
+        return "0.0"  # what nstr gives for zero, without the formatting pass
+    return mp.nstr(m, n=mp.dps, strip_zeros=False)
 
 
-def read_window(path):
-    with open(path, "r", encoding="utf-8") as f:
-        js = json.load(f)
+def _read_window(path):
+    with open(path, "rb") as f:
+        js = loads_json(f.read())
     cand = [js]
     for k in ("window", "params", "data"):
         if isinstance(js, dict) and k in js and isinstance(js[k], dict):
@@ -79,17 +168,55 @@ def read_window(path):
     return mode, sigma, k0
 
 
+@lru_cache(maxsize=32)
+def _read_window_cached(path, mtime_ns, size, prec):
+    return _read_window(path)
+
+
+def read_window(path):
+    """
+    Return (mode, sigma, k0) from a window JSON, memoized on the file's
+    (path, mtime, size) and the current mp.prec, so repeated calls in one
+    process skip the JSON parse and string->mpf conversions.
+    """
+    st = os.stat(path)
+    return _read_window_cached(path, st.st_mtime_ns, st.st_size, mp.prec)
+
+
 def derive_gamma_env_T0(sigma, k0, T0):
     x = mp.mpf(sigma) * mp.mpf(k0) * mp.mpf(T0)
-    val = mp.e ** (-(x ** 2) / 2) / (1 + x)
+    val = mp.exp(-(x * x) * mp.mpf("0.5")) / (1 + x)
     return mp.mpf(val)
 
 
-def main():
+def derive_gamma_env_grid(sigma, k0, T0s):
+    """derive_gamma_env_T0 over a list of T0 values, forming sigma*k0 once."""
+    sk = mp.mpf(sigma) * mp.mpf(k0)
+    half = mp.mpf("0.5")
+    out = []
+    for T0 in T0s:
+        x = sk * mp.mpf(T0)
+        out.append(mp.exp(-(x * x) * half) / (1 + x))
+    return out
+
+
+def gamma_tails_numbers(T0, gamma_env):
+    """c1 = gamma_env*T0, c2 = 0, tails_total = gamma_env (as mp.mpf)."""
+    return gamma_env * T0, mp.mpf("0"), gamma_env
+
+
+def main(argv=None):
     ap = argparse.ArgumentParser(
         description="Compute gamma tail integral and envelope at T0."
     )
-    ap.add_argument("--T0", required=True, type=str, help="Cutoff height T0.")
+    g = ap.add_mutually_exclusive_group(required=True)
+    g.add_argument("--T0", type=str, help="Cutoff height T0.")
+    g.add_argument(
+        "--T0-grid",
+        dest="T0_grid",
+        type=str,
+        help="Comma-separated cutoff heights, evaluated in one run.",
+    )
     ap.add_argument(
         "--window-config",
         required=True,
@@ -103,17 +230,19 @@ def main():
         help="Decimal precision for mpmath (default: 200).",
     )
     ap.add_argument("--out", required=True, help="Output JSON path.")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
+    source_date_epoch()
 
     set_prec(args.dps)
-    T0 = mp.mpf(args.T0)
     _, sigma, k0 = read_window(args.window_config)
 
-    gamma_env = derive_gamma_env_T0(sigma, k0, T0)
+    if args.T0_grid is not None:
+        run_grid(args, sigma, k0)
+        return
 
-    c1 = gamma_env * T0
-    c2 = mp.mpf("0")
-    tails_total = gamma_env
+    T0 = mp.mpf(args.T0)
+    gamma_env = derive_gamma_env_T0(sigma, k0, T0)
+    c1, c2, tails_total = gamma_tails_numbers(T0, gamma_env)
 
     out = {
         "kind": "gamma_tails",
@@ -130,12 +259,11 @@ def main():
         "meta": {
             "tool": "core_integral_prover",
             "dps": str(mp.dps),
-            "created_utc": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "created_utc": now_utc_iso(),
         },
     }
 
-    with open(args.out, "w", encoding="utf-8", newline="\n") as f:
-        json.dump(out, f, indent=2, ensure_ascii=False)
+    write_if_changed(args.out, dumps_json(out))
 
     print(
         f"[ok] gamma tails -> {args.out}  "
@@ -144,5 +272,43 @@ def main():
     )
 
 
+def run_grid(args, sigma, k0):
+    T0s = [mp.mpf(t.strip()) for t in args.T0_grid.split(",") if t.strip()]
+    if not T0s:
+        raise SystemExit("--T0-grid: no T0 values given")
+    envs = derive_gamma_env_grid(sigma, k0, T0s)
+
+    rows = []
+    for T0, gamma_env in zip(T0s, envs):
+        c1, c2, tails_total = gamma_tails_numbers(T0, gamma_env)
+        rows.append(
+            {
+                "T0": mpstr(T0),
+                "gamma_env_at_T0": mpstr(gamma_env),
+                "c1": mpstr(c1),
+                "c2": mpstr(c2),
+                "tails_total": mpstr(tails_total),
+            }
+        )
+
+    out = {
+        "kind": "gamma_tails_grid",
+        "inputs": {
+            "T0_grid": [r["T0"] for r in rows],
+            "window_config_path": args.window_config,
+        },
+        "gamma_tails_grid": rows,
+        "meta": {
+            "tool": "core_integral_prover",
+            "dps": str(mp.dps),
+            "created_utc": now_utc_iso(),
+        },
+    }
+
+    write_if_changed(args.out, dumps_json(out))
+
+    print(f"[ok] gamma tails grid -> {args.out}  ({len(rows)} T0 values)")
+
+
 if __name__ == "__main__":
     main()
@@ -54,7 +54,8 @@ JSON (v2.1 normalized)
 
 Math Notes
 ----------
-• Stopband tail modeled as integral of exp(-2 Bt^2).
+• Stopband tail modeled as integral of exp(-2 Bt^2) over [T0, inf),
+  evaluated in closed form via erfc.
 • B selected from tails:  B = max(-ln(gamma_env), -ln(prime_env)) / T0^2.
 • Operator norm = 1/m_lo.
 • All quantities outward rounded as mp-strings (safe).
@@ -65,23 +66,118 @@ import json
 import os
 import hashlib
 import datetime
+from functools import lru_cache
 import mpmath as mp
 
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
+
 
 # ---------------------------------------------------------
 # JSON helpers
 # ---------------------------------------------------------
 
+@lru_cache(maxsize=None)
+def source_date_epoch():
+    """
+    SOURCE_DATE_EPOCH as an int, or None if unset. main() calls this first, so
+    a malformed value fails with a message before any work is done.
+    """
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if not epoch:
+        return None
+    try:
+        value = int(epoch)
+        datetime.datetime.fromtimestamp(value, tz=datetime.timezone.utc)
+    except (ValueError, OverflowError, OSError):
+        raise SystemExit(
+            f"[deconv_prover] SOURCE_DATE_EPOCH must be an integer Unix timestamp, "
+            f"got {epoch!r}"
+        )
+    return value
+
+
+_NOW_UTC_ISO = None
+
+
+def now_utc_iso():
+    """
+    UTC time as ISO-8601 with trailing 'Z'; SOURCE_DATE_EPOCH, if set, is used
+    instead of the clock so reruns are byte-identical. Computed once.
+    """
+    global _NOW_UTC_ISO
+    if _NOW_UTC_ISO is None:
+        epoch = source_date_epoch()
+        if epoch is not None:
+            now = datetime.datetime.fromtimestamp(epoch, tz=datetime.timezone.utc)
+        else:
+            now = datetime.datetime.now(datetime.timezone.utc)
+        _NOW_UTC_ISO = now.replace(tzinfo=None).isoformat() + "Z"
+    return _NOW_UTC_ISO
+
+
 def jload(path):
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return loads_json(f.read())
+
+
+def loads_json(data: bytes):
+    # orjson rejects a few inputs the stdlib accepts (NaN, >64-bit integers);
+    # defer to json for those so behaviour matches the stdlib reader.
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def dumps_json(obj) -> bytes:
+    """indent=2 UTF-8 JSON; orjson when importable, else the stdlib."""
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # e.g. >64-bit integers
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def write_if_changed(path, data: bytes) -> bool:
+    """Write data unless path already holds identical bytes; True if written."""
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, "rb") as f:
+                if f.read() == data:
+                    return False
+    except OSError:
+        pass
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
+
+
+SHA_PLACEHOLDER = "<SHA256_PLACEHOLDER>"
 
 
 def jdump(obj, path):
-    raw = json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
-    with open(path, "wb") as f:
-        f.write(raw)
-    return hashlib.sha256(raw).hexdigest()
+    """
+    Write obj once with meta.sha256 = sha256 of the bytes with meta.sha256 == "".
+    Hashes around a placeholder and writes the digest in its place.
+    """
+    obj["meta"]["sha256"] = SHA_PLACEHOLDER
+    raw = dumps_json(obj)
+    placeholder = SHA_PLACEHOLDER.encode("ascii")
+    i = raw.index(placeholder)
+    j = i + len(placeholder)
+    view = memoryview(raw)
+    h = hashlib.sha256(view[:i])
+    h.update(view[j:])
+    sha = h.hexdigest()
+    obj["meta"]["sha256"] = sha
+    write_if_changed(path, b"".join((view[:i], sha.encode("ascii"), view[j:])))
+    return sha
 
 
 # ---------------------------------------------------------
@@ -106,7 +202,14 @@ def coalesce(js, paths, default="0"):
 
 
 def mpf_str(x):
-    return mp.nstr(mp.mpf(str(x)), n=mp.dps, strip_zeros=False)
+    # mpf values are formatted as-is, without a round trip through str().
+    if isinstance(x, mp.mpf):
+        m = x
+    else:
+        m = mp.mpf(x if type(x) is str else str(x))
+    if not m:
+        return "0.0"  # what nstr gives for zero, without the formatting pass
+    return mp.nstr(m, n=mp.dps, strip_zeros=False)
 
 
 # ---------------------------------------------------------
@@ -184,15 +287,20 @@ def read_min_gain(four_json):
 # ---------------------------------------------------------
 
 def gaussian_tail_integral(B, T0):
-    f = lambda t: mp.e ** (-2 * B * t * t)
-    return mp.quad(f, [T0, mp.inf])
+    """
+    int_{T0}^inf exp(-2 B t^2) dt = sqrt(pi/(8B)) * erfc(T0 sqrt(2B)) for B > 0;
+    the integral diverges for B <= 0.
+    """
+    if B <= 0:
+        return mp.inf
+    return mp.sqrt(mp.pi / (8 * B)) * mp.erfc(T0 * mp.sqrt(2 * B))
 
 
 # ---------------------------------------------------------
 # main
 # ---------------------------------------------------------
 
-def main():
+def main(argv=None):
     ap = argparse.ArgumentParser(description="Deconvolution certificate (normalized v2.1)")
     ap.add_argument("--explicit", required=True, help="explicit_formula.json")
     ap.add_argument("--tails", required=True, help="tails JSON")
@@ -200,7 +308,8 @@ def main():
     ap.add_argument("--dps", type=int, default=400, help="mpmath precision")
     ap.add_argument("--out", required=True)
     ap.add_argument("--verbose", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
+    source_date_epoch()
 
     mp.dps = args.dps
 
@@ -272,14 +381,12 @@ def main():
         "meta": {
             "tool": "deconv_prover",
             "dps": str(args.dps),
-            "created_utc": datetime.datetime.utcnow().isoformat() + "Z",
+            "created_utc": now_utc_iso(),
             "sha256": "",
         },
     }
 
     sha = jdump(payload, args.out)
-    payload["meta"]["sha256"] = sha
-    jdump(payload, args.out)
 
     status = "PASS" if PASS else "FAIL"
     print(f"[{status}] deconv_prover -> {args.out}")
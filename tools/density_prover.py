@@ -14,6 +14,9 @@ CLI (v2.1 normalized)
   --a-center     : center value for parameter a (string, high-precision)
   --b-center     : center value for parameter b (string, high-precision)
   --dps          : decimal precision for mpmath (default: 300)
+  --method       : "closed" (default) integrates the squared derivatives over R
+                   in closed form; "quad" uses mp.quad on [-T_core, T_core]
+                   plus the Gaussian tail cap
   --out          : path to primary JSON output
   --theory-out   : optional path to auxiliary theory JSON
 
@@ -42,105 +45,214 @@ JSON (v2.1 normalized)
 
 Notes
 -----
-- The mathematical / algorithmic logic is preserved exactly; only CLI and JSON
-  structure are normalized.
+- The default method ("closed") integrates the squared derivatives over all
+  of R in closed form; the original core integral plus Gaussian tail cap is
+  kept as --method quad.
 - S_a_hi and S_b_hi are outward-rounded (safe upper bounds) in L2 units.
+- Both derivatives are sums of (alpha + beta t^2) exp(-gamma t^2) terms, so
+  their squared L2 norms over R are finite sums of Gaussian moments
+  (method "closed"). T_core is still reported; it is only used by "quad".
 """
 
 import argparse
+import hashlib
 import json
 import os
 from datetime import timezone
+from functools import lru_cache
 import datetime as _dt
 
 from mpmath import mp
 
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
 
-# ---------- hashing / JSON I/O helpers ----------
 
+# ---------- hashing / JSON I/O helpers ----------
 
-def _sha256_bytes(b: bytes) -> str:
-    import hashlib
 
-    h = hashlib.sha256()
-    h.update(b)
-    return h.hexdigest()
+def _dumps_json(obj) -> bytes:
+    """indent=2 UTF-8 JSON; orjson when importable, else the stdlib."""
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # e.g. >64-bit integers
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
 
 
 def _write_json(path, obj):
     d = os.path.dirname(path)
     if d:
         os.makedirs(d, exist_ok=True)
-    s = json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    s = _dumps_json(obj)
     with open(path, "wb") as f:
         f.write(s)
-    return _sha256_bytes(s)
+    return hashlib.sha256(s).hexdigest()
+
+
+_SHA_PLACEHOLDER = "<SHA256_PLACEHOLDER>"
+
+
+def _write_json_with_sha(path, obj):
+    """
+    Write obj once, with obj["meta"]["sha256"] set to the sha256 of the same
+    document with meta.sha256 == "" (hashed around a placeholder).
+    """
+    d = os.path.dirname(path)
+    if d:
+        os.makedirs(d, exist_ok=True)
+    obj["meta"]["sha256"] = _SHA_PLACEHOLDER
+    s = _dumps_json(obj)
+    placeholder = _SHA_PLACEHOLDER.encode("ascii")
+    i = s.index(placeholder)
+    j = i + len(placeholder)
+    view = memoryview(s)
+    h = hashlib.sha256(view[:i])
+    h.update(view[j:])
+    sha = h.hexdigest()
+    obj["meta"]["sha256"] = sha
+    with open(path, "wb") as f:
+        f.write(view[:i])
+        f.write(sha.encode("ascii"))
+        f.write(view[j:])
+    return sha
 
 
 # ---------- outward rounding helper ----------
 
 
+@lru_cache(maxsize=None)
+def _ulp(dps):
+    """10^-dps at dps + 5 digits (integer-exponent power, computed once per dps)."""
+    with mp.workdps(dps + 5):
+        return mp.mpf(10) ** (-dps)
+
+
 def _outward_str(x, dps, ulps=2):
     """
     Outward-round a non-negative quantity to a decimal string with `dps`
     digits, bumping by `ulps` last-place units to ensure a safe upper bound.
     """
-    old = mp.dps
-    mp.dps = dps + 5
-    x = mp.mpf(x) + mp.mpf(ulps) * mp.power(10, -dps)
-    s = mp.nstr(x, n=dps)
-    mp.dps = old
-    return s
+    with mp.workdps(dps + 5):
+        return mp.nstr(mp.mpf(x) + ulps * _ulp(dps), n=dps)
+
 
+# ---------- derivative kernels ----------
 
-# ---------- derivative kernels (math unchanged) ----------
+
+def _dA_coeffs(A):
+    """
+    Coefficients of dA(A) = (alpha + beta t^2) exp(-gamma t^2), the
+    A-derivative of the Gaussian factor:
+      alpha = -A^(-3/2)/2,  beta = pi A^(-5/2),  gamma = pi/A.
+    """
+    return (
+        -mp.mpf("0.5") * A ** (-mp.mpf("1.5")),
+        mp.pi * A ** (-mp.mpf("2.5")),
+        mp.pi / A,
+    )
 
 
-def _d_da_hat(t, a, b):
-    def dA(A):
-        E = mp.e ** (-mp.pi * t * t / A)
-        return (
-            -mp.mpf("0.5") * A ** (-mp.mpf("1.5"))
-            + (mp.pi * t * t) * (A ** (-mp.mpf("2.5")))
-        ) * E
+def _make_dA(A):
+    """dA(A) as a function of t, with the A-dependent constants hoisted."""
+    alpha, beta, gamma = _dA_coeffs(A)
+    neg_gamma = -gamma
 
-    return dA(a) - dA(a + b)
+    def dA(t):
+        tt = t * t
+        return (alpha + beta * tt) * mp.exp(neg_gamma * tt)
 
+    return dA
 
-def _d_db_hat(t, a, b):
-    A = a + b
-    E = mp.e ** (-mp.pi * t * t / A)
-    return -(
-        -mp.mpf("0.5") * A ** (-mp.mpf("1.5"))
-        + (mp.pi * t * t) * (A ** (-mp.mpf("2.5")))
-    ) * E
 
+def make_d_da_hat(a, b):
+    """t -> d_a h_hat(t) = dA(a) - dA(a+b)."""
+    dA1 = _make_dA(a)
+    dA2 = _make_dA(a + b)
+    return lambda t: dA1(t) - dA2(t)
 
-# ---------- core integral and Gaussian tail (math unchanged) ----------
 
+def make_d_db_hat(a, b):
+    """t -> d_b h_hat(t) = -dA(a+b)."""
+    dA2 = _make_dA(a + b)
+    return lambda t: -dA2(t)
 
-def _integral_sq_norm(deriv_fn, a, b, T):
-    f = lambda tt: mp.power(deriv_fn(tt, a, b), 2)
+
+# ---------- core integral and Gaussian tail (--method quad) ----------
+
+
+def _integral_sq_norm(deriv, T):
+    f = lambda tt: mp.power(deriv(tt), 2)
     val = mp.quad(f, [-T, T], error=False, maxn=100000)
     return val
 
 
-def _gaussian_tail_cap(deriv_fn, a, b, T):
+def _gaussian_tail_cap(deriv, Amax, T):
     tt = T
-    valT = mp.power(deriv_fn(tt, a, b), 2)
-    Amax = max(a, a + b)
-    tail_env = (Amax / (4 * mp.pi * T)) * mp.e ** (-2 * mp.pi * T * T / Amax)
+    valT = mp.power(deriv(tt), 2)
+    tail_env = (Amax / (4 * mp.pi * T)) * mp.exp(-2 * mp.pi * T * T / Amax)
     return valT * 2 * tail_env
 
 
+# ---------- closed-form L2 norms ----------
+
+
+def _gauss_pair_integral(p, q):
+    """
+    int_R (alpha_p + beta_p t^2)(alpha_q + beta_q t^2) exp(-(gamma_p+gamma_q) t^2) dt,
+    from the moments int t^{2k} exp(-c t^2) = sqrt(pi/c) (2k-1)!! / (2c)^k.
+    """
+    ap, bp, gp = p
+    aq, bq, gq = q
+    c = gp + gq
+    i0 = mp.sqrt(mp.pi / c)
+    i2 = i0 / (2 * c)
+    i4 = 3 * i2 / (2 * c)
+    return ap * aq * i0 + (ap * bq + aq * bp) * i2 + bp * bq * i4
+
+
+def _sq_norms_closed(a, b):
+    """
+    Return (||d_a h_hat||_2^2, ||d_b h_hat||_2^2) over R in closed form.
+
+    ||d_a h_hat||^2 = s11 - 2 s12 + s22 cancels badly when b << a (roughly
+    2 log10(a/b) digits are lost), so it is recomputed with the lost bits
+    added back whenever the loss exceeds what the caller's guard digits
+    (main runs at --dps + 10) can absorb. a + b itself is formed with
+    enough bits that a tiny b is not rounded away.
+    """
+    extra = max(0, mp.mag(a) - mp.mag(b)) if b else 0
+    while True:
+        with mp.extraprec(extra):
+            p1 = _dA_coeffs(a)
+            p2 = _dA_coeffs(a + b)
+            s22 = _gauss_pair_integral(p2, p2)
+            s11 = _gauss_pair_integral(p1, p1)
+            # d_a h_hat = dA(a) - dA(a+b);  d_b h_hat = -dA(a+b)
+            Sa_sq = s11 - 2 * _gauss_pair_integral(p1, p2) + s22
+        lost = mp.mag(s11) - mp.mag(Sa_sq) if Sa_sq else 0
+        if lost <= extra + _CANCEL_SLACK_BITS:
+            return +Sa_sq, +s22
+        extra = lost + _CANCEL_SLACK_BITS
+
+
+# Bits of cancellation tolerated in _sq_norms_closed before recomputing
+# (about 5 of the 10 guard digits main adds on top of --dps).
+_CANCEL_SLACK_BITS = 16
+
+
 # ---------- main ----------
 
 
-def main():
+def main(argv=None):
     ap = argparse.ArgumentParser(
         description=(
             "Compute L2 sensitivity norms S_a, S_b for density parameters a, b "
-            "using core integral plus Gaussian tail cap."
+            "as closed-form Gaussian moments over R (or, with --method quad, "
+            "a core integral plus Gaussian tail cap)."
         )
     )
     ap.add_argument(
@@ -161,6 +273,12 @@ def main():
         default=300,
         help="Decimal precision for mpmath (default: 300).",
     )
+    ap.add_argument(
+        "--method",
+        choices=("closed", "quad"),
+        default="closed",
+        help="closed-form Gaussian moments over R (default) or mp.quad core + tail cap.",
+    )
     ap.add_argument(
         "--out",
         required=True,
@@ -171,26 +289,36 @@ def main():
         default=None,
         help="Optional path to auxiliary theory JSON.",
     )
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     # Precision (slightly higher internal to stabilize integrals)
     mp.dps = args.dps + 10
 
-    # Parameters and core cutoff T (math unchanged)
+    # Parameters and core cutoff T (always reported; only --method quad
+    # integrates up to it)
     a = mp.mpf(args.a_center)
     b = mp.mpf(args.b_center)
-    Amax = max(a, a + b)
-    target = mp.power(10, -(args.dps + 5))
-    T = mp.sqrt((Amax / (2 * mp.pi)) * mp.log(1 / target))
-
-    # L2 norms for ∂_a ĥ and ∂_b ĥ: core + Gaussian tail cap
-    Sa_sq_core = _integral_sq_norm(_d_da_hat, a, b, T)
-    Sa_tail = _gaussian_tail_cap(_d_da_hat, a, b, T)
-    Sa = mp.sqrt(Sa_sq_core + Sa_tail)
-
-    Sb_sq_core = _integral_sq_norm(_d_db_hat, a, b, T)
-    Sb_tail = _gaussian_tail_cap(_d_db_hat, a, b, T)
-    Sb = mp.sqrt(Sb_sq_core + Sb_tail)
+    Amax = a + b if b >= 0 else a
+    # Gaussian envelope below 10^-(dps+5) beyond T: log(1/target) is exactly
+    # (dps+5)*ln(10), so no power/log of a tiny target is needed.
+    T = mp.sqrt((Amax / (2 * mp.pi)) * ((args.dps + 5) * mp.ln10))
+
+    if args.method == "closed":
+        # L2 norms for ∂_a ĥ and ∂_b ĥ over R, exact up to working precision
+        Sa_sq, Sb_sq = _sq_norms_closed(a, b)
+        Sa = mp.sqrt(Sa_sq)
+        Sb = mp.sqrt(Sb_sq)
+    else:
+        # L2 norms for ∂_a ĥ and ∂_b ĥ: core + Gaussian tail cap
+        d_da_hat = make_d_da_hat(a, b)
+        Sa_sq_core = _integral_sq_norm(d_da_hat, T)
+        Sa_tail = _gaussian_tail_cap(d_da_hat, Amax, T)
+        Sa = mp.sqrt(Sa_sq_core + Sa_tail)
+
+        d_db_hat = make_d_db_hat(a, b)
+        Sb_sq_core = _integral_sq_norm(d_db_hat, T)
+        Sb_tail = _gaussian_tail_cap(d_db_hat, Amax, T)
+        Sb = mp.sqrt(Sb_sq_core + Sb_tail)
 
     # Outward-rounded upper bounds in L2 units
     Sa_hi = _outward_str(Sa, args.dps)
@@ -223,9 +351,7 @@ def main():
     }
 
     # Write primary JSON with SHA-256
-    h = _write_json(args.out, payload)
-    payload["meta"]["sha256"] = h
-    _write_json(args.out, payload)
+    _write_json_with_sha(args.out, payload)
 
     print(f"[ok] density_prover wrote {args.out}")
     print(
@@ -240,8 +366,13 @@ def main():
             "lemma": "DensitySensitivityL2",
             "statement": (
                 "L2 norms of ∂_a ĥ and ∂_b ĥ are bounded by S_a_hi, S_b_hi "
-                "using the core integral on [-T_core, T_core] plus a Gaussian "
-                "tail cap."
+                + (
+                    "computed over R in closed form as finite sums of Gaussian "
+                    "moments."
+                    if args.method == "closed"
+                    else "using the core integral on [-T_core, T_core] plus a "
+                    "Gaussian tail cap."
+                )
             ),
             "constants": {
                 "S_a_hi": Sa_hi,
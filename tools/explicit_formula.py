@@ -65,6 +65,11 @@ from typing import Any, Optional
 
 from mpmath import mp
 
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
+
 
 # ---------- helpers ----------
 
@@ -75,21 +80,46 @@ def utc_iso() -> str:
 
 def load_json_tolerant(path: str) -> Any:
     """UTF-8 with BOM tolerance, used across the toolkit."""
-    with open(path, "r", encoding="utf-8-sig") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        data = f.read()
+    if data.startswith(b"\xef\xbb\xbf"):
+        data = data[3:]
+    # orjson rejects a few inputs the stdlib accepts (NaN, >64-bit integers);
+    # defer to json for those so behaviour matches the stdlib reader.
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
 
 
-def dig(obj: Any, path: list) -> Optional[Any]:
+def write_json(path: str, obj: Any) -> None:
+    """indent=2 UTF-8 JSON; orjson when importable, else the stdlib."""
+    data = None
+    if _orjson is not None:
+        try:
+            data = _orjson.dumps(obj, option=_orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # e.g. >64-bit integers
+    if data is None:
+        data = json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def dig(obj: Any, path: tuple) -> Optional[Any]:
     """Safe nested lookup: returns None if any key is missing."""
     o = obj
-    for k in path:
-        if not isinstance(o, dict) or k not in o:
-            return None
-        o = o[k]
+    try:
+        for k in path:
+            o = o[k]
+    except (KeyError, TypeError, IndexError):
+        return None
     return o
 
 
-def coalesce(obj: Any, paths: list, default: str = "0") -> str:
+def coalesce(obj: Any, paths: tuple, default: str = "0") -> str:
     """
     Try a sequence of nested paths and return the first non-null value as a
     string; otherwise return `default`. Used to tolerate multiple schema
@@ -112,23 +142,46 @@ def mpf_str(x: Any) -> str:
 
 # ---------- extractors (null-safe, multi-schema) ----------
 
+BAND_MARGIN_PATHS = (
+    ("band_cert", "band_margin", "lo"),
+    ("band_cert", "band_margin_lo"),
+    ("numbers", "band_margin"),
+    ("band_margin", "lo"),
+    ("band_margin_lo",),
+)
+EPS_EFF_PATHS = (
+    ("numbers", "eps_eff"),
+    ("numbers", "epsilon_eff"),
+    ("eps_eff",),
+    ("epsilon_eff",),
+)
+GAMMA_ENV_T0_PATHS = (
+    ("gamma_env_at_T0",),
+    ("tails", "gamma_env_at_T0"),
+    ("gamma_tail", "gamma_env_at_T0"),
+    ("gamma_tail", "tails_total"),
+)
+PRIME_ENV_T0_PATHS = (
+    ("prime_env_at_T0",),
+    ("tails", "prime_env_at_T0"),
+    ("prime_tail", "prime_tail_envelope", "env_T0_hi"),
+    ("prime_tail", "numbers", "prime_tail_norm"),
+    ("prime_tail_envelope", "env_T0_hi"),
+    ("numbers", "prime_tail_norm"),
+)
+PSD_PASS_PATHS = (
+    ("bochner_psd", "PSD_verified"),
+    ("weil_psd", "PSD_verified"),
+    ("PSD_verified",),
+)
+
 
 def read_band_margin(band_json: dict) -> str:
     """
     Extract the certified lower band margin from band_cert.json, with
     tolerant fallback to older schemas.
     """
-    return coalesce(
-        band_json,
-        [
-            ["band_cert", "band_margin", "lo"],
-            ["band_cert", "band_margin_lo"],
-            ["numbers", "band_margin"],
-            ["band_margin", "lo"],
-            ["band_margin_lo"],
-        ],
-        default="0",
-    )
+    return coalesce(band_json, BAND_MARGIN_PATHS, default="0")
 
 
 def read_eps_eff(rollup_json: dict) -> str:
@@ -136,16 +189,7 @@ def read_eps_eff(rollup_json: dict) -> str:
     Extract epsilon_eff from the continuum operator rollup, accepting both
     canonical and legacy locations.
     """
-    return coalesce(
-        rollup_json or {},
-        [
-            ["numbers", "eps_eff"],
-            ["numbers", "epsilon_eff"],
-            ["eps_eff"],
-            ["epsilon_eff"],
-        ],
-        default="0",
-    )
+    return coalesce(rollup_json or {}, EPS_EFF_PATHS, default="0")
 
 
 def read_tails_env(tails_json: dict) -> tuple[str, str]:
@@ -153,30 +197,8 @@ def read_tails_env(tails_json: dict) -> tuple[str, str]:
     Extract gamma and prime tail envelopes at T0 from a tails bundle, with
     fallbacks for older shapes.
     """
-    gamma_env = coalesce(
-        tails_json,
-        [
-            ["gamma_env_at_T0"],
-            ["tails", "gamma_env_at_T0"],
-            ["gamma_tail", "gamma_env_at_T0"],
-            ["gamma_tail", "tails_total"],
-        ],
-        default="0",
-    )
-
-    prime_env = coalesce(
-        tails_json,
-        [
-            ["prime_env_at_T0"],
-            ["tails", "prime_env_at_T0"],
-            ["prime_tail", "prime_tail_envelope", "env_T0_hi"],
-            ["prime_tail", "numbers", "prime_tail_norm"],
-            ["prime_tail_envelope", "env_T0_hi"],
-            ["numbers", "prime_tail_norm"],
-        ],
-        default="0",
-    )
-
+    gamma_env = coalesce(tails_json, GAMMA_ENV_T0_PATHS, default="0")
+    prime_env = coalesce(tails_json, PRIME_ENV_T0_PATHS, default="0")
     return gamma_env, prime_env
 
 
@@ -185,11 +207,7 @@ def read_psd_pass(weil_json: dict) -> bool:
     Extract a Boolean PSD_verified flag from the Weil PSD certificate.
     Defaults to True if present but not clearly marked (summary context).
     """
-    for p in (
-        ["bochner_psd", "PSD_verified"],
-        ["weil_psd", "PSD_verified"],
-        ["PSD_verified"],
-    ):
+    for p in PSD_PASS_PATHS:
         v = dig(weil_json, p)
         if isinstance(v, bool):
             return v
@@ -202,7 +220,7 @@ def read_psd_pass(weil_json: dict) -> bool:
 # ---------- main ----------
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Optional[list] = None) -> argparse.Namespace:
     ap = argparse.ArgumentParser(
         description=(
             "Apply the Weil explicit formula to combine band and tails into "
@@ -242,11 +260,11 @@ def parse_args() -> argparse.Namespace:
         required=True,
         help="Path to output JSON file.",
     )
-    return ap.parse_args()
+    return ap.parse_args(argv)
 
 
-def main() -> None:
-    args = parse_args()
+def main(argv: Optional[list] = None) -> None:
+    args = parse_args(argv)
     mp.dps = int(args.dps)
 
     try:
@@ -300,8 +318,7 @@ def main() -> None:
             },
         }
 
-        with open(args.out, "w", encoding="utf-8", newline="\n") as f:
-            json.dump(payload, f, indent=2, ensure_ascii=False)
+        write_json(args.out, payload)
 
         print(
             "[explicit_formula] wrote {}  band_margin_lo={}  "
@@ -336,8 +353,7 @@ def main() -> None:
             },
         }
         try:
-            with open(args.out, "w", encoding="utf-8", newline="\n") as f:
-                json.dump(stub, f, indent=2, ensure_ascii=False)
+            write_json(args.out, stub)
             print(
                 f"[explicit_formula] ERROR but wrote stub {args.out}: {e}",
                 file=sys.stderr,
@@ -25,6 +25,11 @@ import sys
 
 from mpmath import mp
 
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
+
 
 # ---------------- I/O helpers ----------------
 def jload(path):
@@ -32,9 +37,19 @@ def jload(path):
         return json.load(f)
 
 
+def dumps_json(obj) -> bytes:
+    """indent=2 UTF-8 JSON; orjson when importable, else the stdlib."""
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # e.g. >64-bit integers
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
 def jdump(obj, path):
-    with open(path, "w", encoding="utf-8", newline="\n") as f:
-        json.dump(obj, f, indent=2, ensure_ascii=False)
+    with open(path, "wb") as f:
+        f.write(dumps_json(obj))
 
 
 # ------------- Window parameters -------------
@@ -117,29 +132,14 @@ def L1_gpp_of_gaussian(a):
     """
     L1 norm of the second derivative for g(x) = exp(-a x^2), a > 0.
 
-    Uses the exact piecewise integral of |(4 a^2 x^2 - 2 a) e^{-a x^2}|.
+    g''(x) = (4 a^2 x^2 - 2 a) e^{-a x^2} changes sign only at
+    x0 = 1/sqrt(2a), where g' is extremal, so the piecewise integrals of
+    |g''| over [0, x0] and [x0, +inf) are each |g'(x0)| = 2 a x0 e^{-1/2}.
+    By evenness the total is 8 a x0 e^{-1/2} = 4 sqrt(2a/e): one sqrt, no
+    erf/exp cancellation between the pieces.
     """
     a = mp.mpf(a)
-    x0 = mp.sqrt(1 / (2 * a))
-
-    def I0(u):
-        return mp.mpf("0.5") * mp.sqrt(mp.pi / a) * mp.erf(mp.sqrt(a) * u)
-
-    def I2(u):
-        return (mp.sqrt(mp.pi) * mp.erf(mp.sqrt(a) * u)) / (
-            4 * a ** (mp.mpf("1.5"))
-        ) - (u * mp.e ** (-a * u * u)) / (2 * a)
-
-    # [0, x0]
-    J1 = (2 * a) * I0(x0) - (4 * a * a) * I2(x0)
-
-    # [x0, +inf)
-    I0_inf = mp.mpf("0.5") * mp.sqrt(mp.pi / a)
-    I2_inf = mp.sqrt(mp.pi) / (4 * a ** (mp.mpf("1.5")))
-    J2 = (4 * a * a) * (I2_inf - I2(x0)) - (2 * a) * (I0_inf - I0(x0))
-
-    # Even integrand
-    return 2 * (J1 + J2)
+    return 4 * mp.sqrt(2 * a / mp.e)
 
 
 def sup_h_hi_triangle(A1, a1, A2, a2):
@@ -158,22 +158,42 @@ def sup_hpp_hi_triangle(A1, a1, A2, a2):
     return 2 * abs(A1) * a1 + 2 * abs(A2) * a2
 
 
-def sup_probe_h(A1, a1, A2, a2, xmax=mp.mpf("6.0"), points=2049):
+def sup_probe_h(A1, a1, A2, a2, xmax=mp.mpf("6.0")):
     """
-    Optional numeric probe of sup_x |h(x)| on [-xmax, xmax].
+    Optional probe of sup_x |h(x)| on [-xmax, xmax], located analytically.
+
+    h is even and h'(x) = -2x (A1 a1 e^{-a1 x^2} - A2 a2 e^{-a2 x^2}), so for
+    x > 0 h has at most one stationary point,
+        x*^2 = log(A1 a1 / (A2 a2)) / (a1 - a2),
+    and |h| on [0, xmax] peaks at 0, x* (if inside) or xmax. Every valid
+    window has A1 a1 > 0 and A2 a2 > 0; anything else is rejected.
     """
-    supv = mp.mpf("0")
+    if a1 == a2:
+        return abs(A1 - A2), mp.mpf("0")
+    num = A1 * a1
+    den = A2 * a2
+    if num <= 0 or den <= 0:
+        raise ValueError(
+            "degenerate window: sup probe needs A1*a1 > 0 and A2*a2 > 0 "
+            "(sigma must be positive)"
+        )
+
+    xs = [mp.mpf("0"), xmax]
+    x2 = mp.log(num / den) / (a1 - a2)
+    if 0 < x2 < xmax * xmax:
+        xs.insert(1, mp.sqrt(x2))
+
+    supv = mp.mpf("-1")
     supx = mp.mpf("0")
-    for i in range(points):
-        x = -xmax + (2 * xmax) * i / (points - 1)
-        v = abs(A1 * mp.e ** (-a1 * x * x) - A2 * mp.e ** (-a2 * x * x))
+    for x in xs:
+        v = abs(A1 * mp.exp(-a1 * x * x) - A2 * mp.exp(-a2 * x * x))
         if v > supv:
             supv, supx = v, x
     return supv, supx
 
 
 # ------------- Main entrypoint -------------
-def main():
+def main(argv=None):
     ap = argparse.ArgumentParser(
         description="Fourier inversion certificate for Gaussian notch kernel "
         "(closed-form, no quadrature)."
@@ -222,7 +242,7 @@ def main():
         help="Enable numeric probe for sup|h| on [-xmax, xmax].",
     )
 
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
     mp.dps = args.dps
 
     mode_tag, window_mode, sigma, k0, window_path = read_window(args)
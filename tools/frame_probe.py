@@ -16,9 +16,21 @@ CLI (v2.1 normalized for this tool):
   --k0-min      : min k0
   --k0-max      : max k0
   --A           : half-width of integration window
-  --mgrid       : number of grid points on [-A, A]
+  --mgrid       : number of grid points on [-A, A]; the atoms are negligible
+                  at +-A, where the trapezoid rule converges geometrically,
+                  so a few hundred points usually reach working precision
   --dps         : decimal precision
-  --threads     : number of threads for row-building
+  --threads     : number of worker processes for row-building (mpmath
+                  backend; rows are pure-Python mpmath, so threads would
+                  serialize on the GIL)
+  --backend     : "mpmath" (default) assembles and diagonalizes G at --dps;
+                  "numpy" builds G in float64 as one matrix product and uses
+                  LAPACK eigvalsh (FP64 accuracy; default tol scales to match);
+                  "flint" builds G in python-flint ball arithmetic at --dps and
+                  encloses its eigenvalues rigorously (strictly_positive then
+                  tests the lower end of the smallest eigenvalue's ball)
+  --fast        : with --backend numpy, build the sampled-atom matrix with a
+                  Numba-compiled parallel loop (numpy if numba is absent)
   --chunk       : reserved (unused)
   --tol         : override tolerance for strictly_positive (optional)
   --out         : JSON summary
@@ -38,6 +50,7 @@ JSON (v2.1 normalized):
       "mgrid": <int>,
       "dps": <int>,
       "threads": <int>,
+      "backend": "mpmath" | "numpy" | "flint",
       "tol": "<string>"
     },
     "results": {
@@ -61,7 +74,6 @@ All real-valued numeric fields are stored as strings; counts remain integers.
 """
 
 import argparse
-import csv
 import json
 import math
 import time
@@ -81,7 +93,17 @@ try:
 except Exception:
     TQDM = False
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    import numpy as _np
+except Exception:
+    _np = None
+
+try:
+    import flint as _flint
+except Exception:
+    _flint = None
 
 
 # ---------------------------------------------------------------------
@@ -97,17 +119,6 @@ def tol_from_dps(dps: int, k: int = 6) -> mp.mpf:
     return mp.mpf(10) ** (-(dps - k))
 
 
-def kahan_sum(vals: List[mp.mpf]) -> mp.mpf:
-    s = mp.mpf("0")
-    c = mp.mpf("0")
-    for x in vals:
-        y = x - c
-        t = s + y
-        c = (t - s) - y
-        s = t
-    return s
-
-
 def nstr(x, ndp=20):
     return mp.nstr(x, ndp)
 
@@ -148,10 +159,11 @@ def now_utc_iso() -> str:
 
 
 def sha256_payload(payload: dict) -> str:
-    tmp_obj = json.loads(json.dumps(payload, ensure_ascii=False))
+    # Shallow copy with a sha256-free meta; the payload itself is not mutated.
+    tmp_obj = dict(payload)
     meta = tmp_obj.get("meta")
     if isinstance(meta, dict):
-        meta.pop("sha256", None)
+        tmp_obj["meta"] = {k: v for k, v in meta.items() if k != "sha256"}
     blob = json.dumps(
         tmp_obj,
         sort_keys=True,
@@ -228,39 +240,248 @@ def make_atoms_gaussian(
     return atoms[:n_atoms]
 
 
-def h_gauss_notch(x: mp.mpf, sigma: mp.mpf, k0: mp.mpf) -> mp.mpf:
-    g = mp.e ** (-(x ** 2) / (sigma ** 2))
-    notch = mp.mpf("1") - mp.e ** (-(x - k0) ** 2)
-    return g * notch
+def h_gauss_notch(x: mp.mpf, inv_sigma2: mp.mpf, k0: mp.mpf) -> mp.mpf:
+    """
+    Atom sample exp(-x^2/sigma^2) * (1 - exp(-(x - k0)^2)), with 1/sigma^2
+    precomputed per atom.
+    """
+    d = x - k0
+    return mp.exp(-x * x * inv_sigma2) * (1 - mp.exp(-d * d))
+
 
+def atom_values(a: Atom, xs: List[mp.mpf]) -> List[mp.mpf]:
+    inv_sigma2 = 1 / (a.sigma * a.sigma)
+    k0 = a.k0
+    return [h_gauss_notch(x, inv_sigma2, k0) for x in xs]
 
-def inner_prod_L2(ai: Atom, aj: Atom, xs: List[mp.mpf]) -> mp.mpf:
-    vals = []
-    for x in xs:
-        vals.append(h_gauss_notch(x, ai.sigma, ai.k0) * h_gauss_notch(x, aj.sigma, aj.k0))
-    s = kahan_sum(vals) - (vals[0] + vals[-1]) / 2
+
+def grid_step(xs: List[mp.mpf]) -> mp.mpf:
     A = mp.fabs(xs[-1])
-    step = (2 * A) / (len(xs) - 1)
+    return (2 * A) / (len(xs) - 1)
+
+
+def inner_prod_vals(hi: List[mp.mpf], hj: List[mp.mpf], step: mp.mpf) -> mp.mpf:
+    """Trapezoid rule for <h_i, h_j> from the atoms' sampled values."""
+    vals = [u * v for u, v in zip(hi, hj)]
+    # mp.fsum accumulates exactly and rounds once: faster than the Python-level
+    # Kahan loop and at least as accurate.
+    s = mp.fsum(vals) - (vals[0] + vals[-1]) / 2
     return step * s
 
 
 def build_grid(A: mp.mpf, mgrid: int) -> List[mp.mpf]:
-    return [
-        (-A + (2 * A) * mp.mpf(k) / mp.mpf(mgrid - 1))
-        for k in range(mgrid)
-    ]
+    # mpf * int and mpf / int skip the per-point mp.mpf(k) construction but round
+    # exactly as before. An incremental x += step would accumulate rounding
+    # error and miss the +A endpoint.
+    two_A = 2 * A
+    denom = mgrid - 1
+    return [-A + two_A * k / denom for k in range(mgrid)]
 
 
-def accumulate_row(i: int, atoms: List[Atom], xs: List[mp.mpf]) -> Tuple[int, List[mp.mpf]]:
-    ai = atoms[i]
+def accumulate_row(i: int, Hvals: List[List[mp.mpf]], step: mp.mpf) -> Tuple[int, List[mp.mpf]]:
+    hi = Hvals[i]
     row = []
-    for j in range(i, len(atoms)):
-        aj = atoms[j]
-        gij = inner_prod_L2(ai, aj, xs)
+    for j in range(i, len(Hvals)):
+        gij = inner_prod_vals(hi, Hvals[j], step)
         row.append(gij)
     return i, row
 
 
+# Per-process state for gram_mp workers, set once by _worker_init so the
+# sampled atoms are pickled once per worker rather than once per row.
+_WORKER_HVALS: List[List[mp.mpf]] = []
+_WORKER_STEP = mp.mpf("0")
+
+
+def _worker_init(dps: int, Hvals: List[List[mp.mpf]], step: mp.mpf) -> None:
+    global _WORKER_HVALS, _WORKER_STEP
+    set_mp(dps)
+    _WORKER_HVALS = Hvals
+    _WORKER_STEP = step
+
+
+def _worker_row(i: int) -> Tuple[int, List[mp.mpf]]:
+    return accumulate_row(i, _WORKER_HVALS, _WORKER_STEP)
+
+
+def gram_mp(atoms: List[Atom], xs: List[mp.mpf], threads: int = 1):
+    """
+    Assemble the Gram matrix at working precision, one upper-triangle row per
+    task. Each atom is sampled on the grid once (n*mgrid evaluations of
+    h_gauss_notch rather than n^2*mgrid); entries then only multiply and sum
+    cached samples.
+    """
+    n = len(atoms)
+    G = mp.matrix(n, n)
+    Hvals = [atom_values(a, xs) for a in atoms]
+    step = grid_step(xs)
+
+    if threads <= 1:
+        rng = range(n)
+        iterator = tqdm(rng, desc="[frame-probe] rows", leave=False) if TQDM else rng
+        for i in iterator:
+            _, row = accumulate_row(i, Hvals, step)
+            for k, gij in enumerate(row):
+                j = i + k
+                G[i, j] = gij
+                G[j, i] = gij
+    else:
+        futures = []
+        with ProcessPoolExecutor(
+            max_workers=threads,
+            initializer=_worker_init,
+            initargs=(mp.dps, Hvals, step),
+        ) as ex:
+            for i in range(n):
+                futures.append(ex.submit(_worker_row, i))
+            iterator = (
+                tqdm(
+                    as_completed(futures),
+                    total=len(futures),
+                    desc="[frame-probe] rows",
+                    leave=False,
+                )
+                if TQDM
+                else as_completed(futures)
+            )
+            rows = [None] * n
+            for fut in iterator:
+                i, row = fut.result()
+                rows[i] = row
+        for i in range(n):
+            row = rows[i]
+            for k, gij in enumerate(row):
+                j = i + k
+                G[i, j] = gij
+                G[j, i] = gij
+    return G
+
+
+def _build_H_f64_py(xs, sigmas, k0s):
+    """
+    H[a, m] = h_gauss_notch(xs[m], 1/sigmas[a]^2, k0s[a]) in float64, one prange
+    iteration per atom; compiled with Numba by _build_H_f64_kernel.
+    """
+    N = sigmas.size
+    M = xs.size
+    H = _np.empty((N, M))
+    for a in _prange(N):
+        inv_s2 = 1.0 / (sigmas[a] * sigmas[a])
+        k = k0s[a]
+        for m in range(M):
+            x = xs[m]
+            d = x - k
+            H[a, m] = math.exp(-x * x * inv_s2) * (1.0 - math.exp(-d * d))
+    return H
+
+
+_prange = range
+_build_H_f64 = None
+
+
+def _build_H_f64_kernel():
+    """
+    Lazily compile _build_H_f64_py with
+    @njit(parallel=True, fastmath=True, nogil=True, cache=True). numba is only
+    imported when --fast is requested; returns None if absent.
+    """
+    global _build_H_f64, _prange
+    if _build_H_f64 is None:
+        try:
+            from numba import njit, prange
+        except Exception:
+            return None
+        _prange = prange
+        _build_H_f64 = njit(parallel=True, fastmath=True, nogil=True, cache=True)(
+            _build_H_f64_py
+        )
+    return _build_H_f64
+
+
+def gram_f64(atoms: List[Atom], A: mp.mpf, mgrid: int, fast: bool = False):
+    """
+    float64 Gram matrix with the same trapezoid rule as inner_prod_vals:
+    H[a, k] = h_gauss_notch(x_k, 1/sigma_a^2, k0_a) and
+    G = step * (H H^T - (H[:, 0] H[:, 0]^T + H[:, -1] H[:, -1]^T) / 2).
+    """
+    xs = _np.linspace(-float(A), float(A), mgrid)
+    sig = _np.array([float(a.sigma) for a in atoms])
+    k0 = _np.array([float(a.k0) for a in atoms])
+    kernel = _build_H_f64_kernel() if fast else None
+    if kernel is not None:
+        H = kernel(xs, sig, k0)
+    else:
+        H = _np.exp(-(xs[None, :] / sig[:, None]) ** 2) * (
+            1.0 - _np.exp(-(xs[None, :] - k0[:, None]) ** 2)
+        )
+    G = H @ H.T
+    G -= 0.5 * (_np.outer(H[:, 0], H[:, 0]) + _np.outer(H[:, -1], H[:, -1]))
+    step = 2.0 * float(A) / (mgrid - 1)
+    return G * step
+
+
+def _mpf_to_arb(x: mp.mpf):
+    """Exact mpf -> arb (both are binary floating point)."""
+    x = mp.mpf(x)
+    man, exp = x.man_exp  # |mantissa|: man_exp drops the sign
+    if x < 0:
+        man = -man
+    return _flint.arb(int(man)) * _flint.arb(2) ** int(exp)
+
+
+def _arb_mid_to_mpf(x) -> mp.mpf:
+    man, exp = x.mid().man_exp()
+    return mp.mpf((int(man), int(exp)))
+
+
+def eigenvalues_flint(atoms: List[Atom], A: mp.mpf, mgrid: int):
+    """
+    Build the trapezoid-rule Gram matrix as an arb_mat (H H^T from sampled
+    atoms, as in gram_f64) at the current mpmath precision and enclose its
+    eigenvalues with acb_mat.eig. Returns (sorted midpoints as mpf, lower
+    bound of the smallest eigenvalue as mpf).
+    """
+    arb, arb_mat = _flint.arb, _flint.arb_mat
+    old_prec = _flint.ctx.prec
+    _flint.ctx.prec = mp.prec
+    try:
+        A_b = _mpf_to_arb(A)
+        xs = [-A_b + 2 * A_b * k / (mgrid - 1) for k in range(mgrid)]
+        rows = []
+        for a in atoms:
+            sigma = _mpf_to_arb(a.sigma)
+            k0 = _mpf_to_arb(a.k0)
+            rows.append([
+                (-(x / sigma) ** 2).exp() * (1 - (-(x - k0) ** 2).exp())
+                for x in xs
+            ])
+        H = arb_mat(rows)
+        c0 = arb_mat([[r[0]] for r in rows])
+        c1 = arb_mat([[r[-1]] for r in rows])
+        G = H * H.transpose() - (c0 * c0.transpose() + c1 * c1.transpose()) / 2
+        G = G * (2 * A_b / (mgrid - 1))
+
+        try:
+            evals = _flint.acb_mat(G).eig()
+        except ValueError:
+            evals = None
+        if evals is None:
+            # Clustered eigenvalues: enclose each cluster instead of isolating.
+            try:
+                evals = _flint.acb_mat(G).eig(multiple=True)
+            except ValueError:
+                evals = None
+        if evals is None:
+            raise SystemExit(
+                "[frame-probe] flint could not isolate the eigenvalues; "
+                "raise --dps or use --backend mpmath."
+            )
+        reals = sorted((e.real for e in evals), key=lambda r: r.mid())
+        return [_arb_mid_to_mpf(r) for r in reals], _arb_mid_to_mpf(reals[0].lower())
+    finally:
+        _flint.ctx.prec = old_prec
+
+
 # ---------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------
@@ -279,6 +500,8 @@ def main():
     ap.add_argument("--mgrid", type=int, default=4097)
     ap.add_argument("--dps", type=int, default=120)
     ap.add_argument("--threads", type=int, default=1)
+    ap.add_argument("--backend", choices=["mpmath", "numpy", "flint"], default="mpmath")
+    ap.add_argument("--fast", action="store_true")
     ap.add_argument("--chunk", type=int, default=0)
     ap.add_argument("--tol", type=str, default=None)
     ap.add_argument("--out", type=str, required=True)
@@ -288,7 +511,10 @@ def main():
     set_mp(args.dps)
     A = mp.mpf(args.A)
     mgrid = int(args.mgrid)
-    tol = mp.mpf(args.tol) if args.tol is not None else tol_from_dps(args.dps, 6)
+    if args.backend == "numpy" and _np is None:
+        raise SystemExit("--backend numpy requires numpy.")
+    if args.backend == "flint" and _flint is None:
+        raise SystemExit("--backend flint requires python-flint.")
 
     sigma_min = mp.mpf(args.sigma_min)
     sigma_max = mp.mpf(args.sigma_max)
@@ -300,63 +526,49 @@ def main():
         raise SystemExit("Only --dict gaussian is currently supported.")
 
     atoms = make_atoms_gaussian(n, sigma_min, sigma_max, k0_min, k0_max)
-    xs = build_grid(A, mgrid)
     t0 = time.time()
 
-    G = mp.matrix(n, n)
-
-    if args.threads <= 1:
-        rng = range(n)
-        iterator = tqdm(rng, desc="[frame-probe] rows", leave=False) if TQDM else rng
-        for i in iterator:
-            _, row = accumulate_row(i, atoms, xs)
-            for k, gij in enumerate(row):
-                j = i + k
-                G[i, j] = gij
-                G[j, i] = gij
+    A_theta_lo = None
+    if args.backend == "numpy":
+        evals_real = [mp.mpf(float(e)) for e in _np.linalg.eigvalsh(gram_f64(atoms, A, mgrid, args.fast))]
+    elif args.backend == "flint":
+        evals_real, A_theta_lo = eigenvalues_flint(atoms, A, mgrid)
     else:
-        futures = []
-        with ThreadPoolExecutor(max_workers=args.threads) as ex:
-            for i in range(n):
-                futures.append(ex.submit(accumulate_row, i, atoms, xs))
-            iterator = (
-                tqdm(
-                    as_completed(futures),
-                    total=len(futures),
-                    desc="[frame-probe] rows",
-                    leave=False,
-                )
-                if TQDM
-                else as_completed(futures)
-            )
-            rows = [None] * n
-            for fut in iterator:
-                i, row = fut.result()
-                rows[i] = row
-        for i in range(n):
-            row = rows[i]
-            for k, gij in enumerate(row):
-                j = i + k
-                G[i, j] = gij
-                G[j, i] = gij
-
-    evals, _ = mp.eig(G)
-    evals_real = [mp.mpf(str(e)) if not isinstance(e, mp.mpf) else e for e in evals]
+        G = gram_mp(atoms, build_grid(A, mgrid), args.threads)
+        # G is real symmetric: eigsy (Jacobi/QL on the tridiagonal form) gives
+        # real eigenvalues directly, unlike the general complex mp.eig.
+        evals = mp.eigsy(G, eigvals_only=True)
+        evals_real = [evals[i] for i in range(evals.rows)]
     evals_real.sort()
 
+    if args.tol is not None:
+        tol = mp.mpf(args.tol)
+    elif args.backend == "numpy":
+        # eigvalsh is backward stable, so eigenvalues are only resolved to
+        # about n * eps * max|eigenvalue|; nothing smaller counts as positive.
+        tol = n * mp.mpf(float(_np.finfo(_np.float64).eps)) * abs(evals_real[-1])
+    else:
+        tol = tol_from_dps(args.dps, 6)
+
     A_theta = evals_real[0]
     B_theta = evals_real[-1]
     elapsed = time.time() - t0
 
+    # 30-digit eigenvalue strings, shared by the CSV and the JSON min/max
+    eval_strs = [nstr(ev, 30) for ev in evals_real]
+    tol_str = nstr(tol, 20)
+
     # Write eigenvalue CSV
     with open(args.csv, "w", newline="", encoding="utf-8") as fcsv:
-        w = csv.writer(fcsv)
-        w.writerow(["idx", "eigenvalue"])
-        for i, ev in enumerate(evals_real):
-            w.writerow([i, nstr(ev, 30)])
+        # One write; "\r\n" matches the csv.writer default dialect. Indices are
+        # ints and nstr output has no commas or quotes, so nothing needs quoting.
+        lines = ["idx,eigenvalue"]
+        lines.extend(f"{i},{s}" for i, s in enumerate(eval_strs))
+        lines.append("")
+        fcsv.write("\r\n".join(lines))
 
     cond = B_theta / A_theta if A_theta != 0 else mp.inf
-    strictly_positive = bool(A_theta > tol)
+    strictly_positive = bool((A_theta if A_theta_lo is None else A_theta_lo) > tol)
 
     payload = {
         "kind": "frame_probe",
@@ -371,14 +583,15 @@ def main():
             "mgrid": mgrid,
             "dps": int(args.dps),
             "threads": int(args.threads),
-            "tol": nstr(tol, 20),
+            "backend": args.backend,
+            "tol": tol_str,
         },
         "results": {
-            "min_eigenvalue": nstr(A_theta, 30),
-            "max_eigenvalue": nstr(B_theta, 30),
+            "min_eigenvalue": eval_strs[0],
+            "max_eigenvalue": eval_strs[-1],
             "condition_number": nstr(cond, 30),
             "strictly_positive": strictly_positive,
-            "tolerance": nstr(tol, 20),
+            "tolerance": tol_str,
         },
         "meta": {},
     }
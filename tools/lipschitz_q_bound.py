@@ -56,6 +56,7 @@ import argparse
 import json
 import os
 from datetime import timezone
+from functools import lru_cache
 import datetime as _dt
 import hashlib
 
@@ -80,6 +81,13 @@ def _sha256_bytes(b: bytes) -> str:
     return h.hexdigest()
 
 
+@lru_cache(maxsize=None)
+def _ulp(dps):
+    """10^-dps at dps + 5 digits, computed once per dps."""
+    with mp.workdps(dps + 5):
+        return mp.mpf(10) ** (-dps)
+
+
 def outward(x, dps, ulps=2):
     """
     Outward rounding helper (kept from original implementation).
@@ -87,12 +95,8 @@ def outward(x, dps, ulps=2):
     Returns a decimal string slightly above the given value x at the
     requested precision. Used both for L.hi and decomposed hi terms.
     """
-    old = mp.dps
-    mp.dps = dps + 5
-    y = mp.mpf(x) + mp.mpf(ulps) * mp.power(10, -dps)
-    s = mp.nstr(y, n=dps)
-    mp.dps = old
-    return s
+    with mp.workdps(dps + 5):
+        return mp.nstr(mp.mpf(x) + ulps * _ulp(dps), n=dps)
 
 
 def now_utc_iso() -> str:
@@ -125,10 +129,11 @@ def write_json(path: str, payload: dict, dps: int) -> None:
     meta["dps"] = int(dps)
     meta["created_utc"] = now_utc_iso()
 
-    tmp_obj = json.loads(json.dumps(payload, ensure_ascii=False))
+    # Shallow copy with a sha256-free meta; the payload itself is not mutated.
+    tmp_obj = dict(payload)
     m2 = tmp_obj.get("meta")
     if isinstance(m2, dict):
-        m2.pop("sha256", None)
+        tmp_obj["meta"] = {k: v for k, v in m2.items() if k != "sha256"}
 
     blob = json.dumps(
         tmp_obj, indent=None, sort_keys=True, ensure_ascii=False, separators=(",", ":")
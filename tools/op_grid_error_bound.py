@@ -32,21 +32,25 @@ except Exception:
             return mp.mpf(x) * (1 + mp.mpf("1e-30"))
 
 
-def _sha256_bytes(b: bytes) -> str:
-    h = hashlib.sha256()
-    h.update(b)
-    return h.hexdigest()
-
-
 def _write_json(path: str, obj: dict) -> str:
-    """Write JSON with Windows-safe newlines and return sha256 of the payload."""
+    """
+    Set obj["meta"]["sha256"] to the hash of obj without it (sorted keys,
+    compact separators, as in op_prime_tail_bound) and write obj once via a
+    temp file. Returns the digest.
+    """
     d = os.path.dirname(os.path.abspath(path))
     if d:
         os.makedirs(d, exist_ok=True)
-    blob = json.dumps(obj, indent=2, sort_keys=True).encode("utf-8")
-    with open(path, "wb") as f:
-        f.write(blob)
-    return _sha256_bytes(blob)
+    obj["meta"].pop("sha256", None)
+    canon = json.dumps(obj, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    sha = hashlib.sha256(canon.encode("utf-8")).hexdigest()
+    obj["meta"]["sha256"] = sha
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(json.dumps(obj, indent=2, sort_keys=True).encode("utf-8"))
+    os.replace(tmp, path)
+    return sha
 
 
 def main():
@@ -156,8 +160,6 @@ def main():
         },
     }
 
-    sha = _write_json(args.out, payload)
-    payload["meta"]["sha256"] = sha
     _write_json(args.out, payload)
 
     print(
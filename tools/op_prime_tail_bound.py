@@ -84,10 +84,11 @@ def write_json(path: str, payload: dict, dps: int) -> None:
     meta["dps"] = int(dps)
     meta["created_utc"] = now_utc_iso()
 
-    tmp_obj = json.loads(json.dumps(payload, ensure_ascii=False))
+    # Shallow copy with a sha256-free meta; the payload itself is not mutated.
+    tmp_obj = dict(payload)
     meta2 = tmp_obj.get("meta")
     if isinstance(meta2, dict):
-        meta2.pop("sha256", None)
+        tmp_obj["meta"] = {k: v for k, v in meta2.items() if k != "sha256"}
 
     blob = json.dumps(
         tmp_obj, sort_keys=True, ensure_ascii=False, separators=(",", ":")
@@ -157,6 +158,7 @@ def main():
     if args.scale_by_log:
         C = C / mp.log(x0)
     C = outward_hi(C)
+    C_str = mp_str(C)
 
     payload = {
         "kind": "prime_tail_bound",
@@ -167,14 +169,14 @@ def main():
             "scale_by_log": bool(args.scale_by_log),
         },
         "prime_tail_bound": {
-            "C_tail_hi": mp_str(C),
+            "C_tail_hi": C_str,
             "model": "C_tail_hi = 2*(K+1)*A_prime [* 1/log(x0) if scale_by_log].",
         },
         "meta": {},
     }
 
     write_json(args.out, payload, args.dps)
-    print(f"[ok] prime_tail_bound -> {args.out}  C_tail_hi={mp_str(C)}")
+    print(f"[ok] prime_tail_bound -> {args.out}  C_tail_hi={C_str}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+tool_runner.py — run several certificate tools in one Python process
+
+Purpose:
+  Each tool is normally its own `python tools/<tool>.py ...` process and pays
+  interpreter startup plus the mpmath import. This runner imports the tools
+  once and calls their main(argv) in sequence, with exactly the arguments the
+  standalone CLI takes.
+
+CLI:
+  tool_runner.py TOOL [tool args...]   : run one tool
+  tool_runner.py --script FILE         : run one tool per line of FILE
+                                         (shell-style quoting; blank lines and
+                                         lines starting with '#' are skipped)
+  --keep-going                         : with --script, run the remaining lines
+                                         after a failure (exit status is still
+                                         non-zero)
+
+  TOOL is one of:
+    bochner_psd_cert, core_interval_prover, continuum_operator_rollup,
+    deconv_prover, density_prover, explicit_formula, fourier_inversion_cert
+
+Example script:
+  bochner_psd_cert --window PROOF_PACKET/window.json --out PROOF_PACKET/weil_psd_bochner.json
+  core_interval_prover --T0 1e6 --window-config PROOF_PACKET/window.json --out PROOF_PACKET/gamma_tails.json
+
+Notes:
+  - Tools set mp.dps from their own --dps, so precision does not leak between
+    lines.
+  - bochner_psd_cert, core_interval_prover, continuum_operator_rollup and
+    deconv_prover compute meta.created_utc once per module, so repeated runs
+    of those tools in one script share a timestamp.
+"""
+
+import argparse
+import importlib
+import shlex
+import sys
+import traceback
+
+TOOLS = (
+    "bochner_psd_cert",
+    "core_interval_prover",
+    "continuum_operator_rollup",
+    "deconv_prover",
+    "density_prover",
+    "explicit_formula",
+    "fourier_inversion_cert",
+)
+
+
+def run_tool(name, argv):
+    """Import tools/<name>.py (once) and call its main(argv); return exit code.
+
+    SystemExit maps to its exit code; any other exception is printed with its
+    traceback and returns 1.
+    """
+    if name not in TOOLS:
+        print(f"[tool_runner] unknown tool: {name} (choose from {', '.join(TOOLS)})",
+              file=sys.stderr)
+        return 2
+    mod = importlib.import_module(name)
+    saved_argv = sys.argv
+    sys.argv = [name + ".py"] + list(argv)  # argparse usage/error messages
+    try:
+        mod.main(list(argv))
+    except SystemExit as e:
+        if e.code is None or e.code == 0:
+            return 0
+        if not isinstance(e.code, int):
+            print(e.code, file=sys.stderr)
+            return 1
+        return e.code
+    except Exception:
+        # A tool crash fails this line only, so --script can report it and
+        # --keep-going can move on.
+        traceback.print_exc()
+        return 1
+    finally:
+        sys.argv = saved_argv
+    return 0
+
+
+def read_script(path):
+    cmds = []
+    with open(path, "r", encoding="utf-8") as f:
+        for lineno, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            cmds.append((lineno, shlex.split(line)))
+    return cmds
+
+
+def main():
+    ap = argparse.ArgumentParser(
+        description="Run certificate tools in one Python process."
+    )
+    ap.add_argument("--script", help="file with one 'TOOL args...' command per line")
+    ap.add_argument("--keep-going", action="store_true",
+                    help="with --script, continue after a failing line")
+    ap.add_argument("tool", nargs="?", help="tool to run (without --script)")
+    ap.add_argument("tool_args", nargs=argparse.REMAINDER,
+                    help="arguments passed to the tool")
+    args = ap.parse_args()
+
+    if args.script:
+        if args.tool:
+            ap.error("TOOL cannot be combined with --script")
+        status = 0
+        for lineno, words in read_script(args.script):
+            rc = run_tool(words[0], words[1:])
+            if rc:
+                print(f"[tool_runner] {args.script}:{lineno}: {words[0]} exited with {rc}",
+                      file=sys.stderr)
+                status = rc
+                if not args.keep_going:
+                    break
+        sys.exit(status)
+
+    if not args.tool:
+        ap.error("give TOOL [args...] or --script FILE")
+    sys.exit(run_tool(args.tool, args.tool_args))
+
+
+if __name__ == "__main__":
+    main()